@@ -2,21 +2,38 @@
 Simple interactive demo of SJSU Agent
 """
 
+import atexit
 import sys
 from pathlib import Path
 
+try:
+    import readline  # Line editing and history for input(); unavailable on Windows
+except ImportError:
+    readline = None
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.agent.agent_orchestrator import AgentOrchestrator
-from src.llm.model_loader import ModelLoader
-from src.database.db_manager import DatabaseManager
-from src.utils.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger('demo')
 
+HISTORY_FILE = Path.home() / ".sjsu_demo_history"
+
+
+def setup_history():
+    """Load previous questions into readline and save them again on exit"""
+    if readline is None:
+        return
+    
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    atexit.register(readline.write_history_file, HISTORY_FILE)
+
 
 def demo_agent():
     """Interactive demo of the SJSU Agent"""
@@ -24,6 +41,12 @@ def demo_agent():
     print("\nSJSU VIRTUAL ASSISTANT - DEMO")
     print("\nInitializing agent...")
     
+    # Imported here so the banner shows before the LLM clients load
+    from src.agent.agent_orchestrator import AgentOrchestrator
+    from src.llm.model_loader import ModelLoader
+    from src.database.db_manager import get_db_manager
+    from src.utils.config import Config
+    
     # Load configuration
     config = Config()
     config.load_from_env()
@@ -31,7 +54,7 @@ def demo_agent():
     # Initialize database
     print("Connecting to database...")
     db_path = project_root / "data" / "sjsu_database.db"
-    db_manager = DatabaseManager(
+    db_manager = get_db_manager(
         db_path=str(db_path),
         collection_name='sjsu_docs'
     )
@@ -55,6 +78,8 @@ def demo_agent():
     print("  4. What's the current SJSU tuition? (uses web search)")
     print("\nType 'quit' to exit\n")
     
+    setup_history()
+    
     while True:
         try:
             # Get user input
@@ -3,114 +3,168 @@
 Demo script showing how to use the database and web search tools
 """
 
+import asyncio
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.database.db_manager import get_db_manager
 from src.tools.database_tool import DatabaseTool
 from src.tools.web_search_tool import WebSearchTool
 from src.utils.logger import logger
 
 
-def print_section(title):
+DB_PATH = './data/sjsu_database.db'
+
+
+@lru_cache(maxsize=None)
+def get_db_tool(db_path=DB_PATH):
+ """Return a shared DatabaseTool so every demo reuses one SQLite connection"""
+ return DatabaseTool(db_manager=get_db_manager(db_path))
+
+
+@lru_cache(maxsize=None)
+def get_web_tool():
+ """Return a shared WebSearchTool so every demo reuses one HTTP session"""
+ return WebSearchTool(max_results=3)
+
+
+def collected_output(demo):
+ """Run a demo section against its own buffer and return the collected text"""
+ @wraps(demo)
+ def wrapper():
+    buffer = io.StringIO()
+    completed = False
+    try:
+       demo(partial(print, file=buffer))
+       completed = True
+       return buffer.getvalue()
+    finally:
+       # A failed section never returns its output, so show what it got through
+       if not completed:
+          sys.stdout.write(buffer.getvalue())
+ return wrapper
+
+
+def print_section(emit, title):
  """Print a section header"""
- print(f"\n{title}\n")
+ emit(f"\n{title}\n")
 
 
-def demo_database_tool():
+@collected_output
+def demo_database_tool(emit):
  """Demonstrate database tool capabilities"""
- print_section("DATABASE TOOL DEMO")
+ print_section(emit, "DATABASE TOOL DEMO")
 
- db_tool = DatabaseTool('./data/sjsu_database.db')
+ db_tool = get_db_tool()
 
  # 1. Search programs
- print(" SEARCHING FOR GRADUATE PROGRAMS:")
+ emit(" SEARCHING FOR GRADUATE PROGRAMS:")
  result = db_tool.search_programs(degree_type="MS")
- print(result)
+ emit(result)
 
  # 2. Get admission requirements
- print("\n\n ADMISSION REQUIREMENTS FOR COMPUTER SCIENCE:")
+ emit("\n\n ADMISSION REQUIREMENTS FOR COMPUTER SCIENCE:")
  result = db_tool.get_admission_requirements("Computer Science")
- print(result)
+ emit(result)
 
  # 3. Get prerequisites
- print("\n\n PREREQUISITES FOR CMPE 259:")
+ emit("\n\n PREREQUISITES FOR CMPE 259:")
  result = db_tool.get_prerequisites("CMPE 259")
- print(result)
+ emit(result)
 
  # 4. Get deadlines
- print("\n\n FALL 2025 DEADLINES:")
+ emit("\n\n FALL 2025 DEADLINES:")
  result = db_tool.get_deadlines(semester="Fall 2025")
- print(result)
+ emit(result)
 
  # 5. Search resources
- print("\n\n CAMPUS RESOURCES (ADVISING):")
+ emit("\n\n CAMPUS RESOURCES (ADVISING):")
  result = db_tool.search_resources(category="Advising")
- print(result)
+ emit(result)
 
  # 6. Search FAQs
- print("\n\n FAQS ABOUT SCHOLARSHIPS:")
+ emit("\n\n FAQS ABOUT SCHOLARSHIPS:")
  result = db_tool.search_faqs("scholarship")
- print(result)
+ emit(result)
 
  # 7. Get student clubs
- print("\n\n ACADEMIC CLUBS:")
+ emit("\n\n ACADEMIC CLUBS:")
  result = db_tool.get_student_clubs(category="Academic")
- print(result)
+ emit(result)
 
 
-def demo_web_search_tool():
+@collected_output
+def demo_web_search_tool(emit):
  """Demonstrate web search tool capabilities"""
- print_section("WEB SEARCH TOOL DEMO")
-
- web_tool = WebSearchTool(max_results=3)
+ print_section(emit, "WEB SEARCH TOOL DEMO")
 
- # 1. General SJSU search
- print(" SEARCHING WEB FOR 'SJSU COMPUTER SCIENCE':")
- result = web_tool.search("SJSU computer science programs")
- print(result)
+ web_tool = get_web_tool()
 
- # 2. SJSU site-specific search
- print("\n\n SEARCHING SJSU.EDU FOR 'ADMISSIONS':")
- result = web_tool.search_sjsu_site("admissions requirements")
- print(result)
+ searches = (
+    (" SEARCHING WEB FOR 'SJSU COMPUTER SCIENCE':", web_tool.search, "SJSU computer science programs"),
+    ("\n\n SEARCHING SJSU.EDU FOR 'ADMISSIONS':", web_tool.search_sjsu_site, "admissions requirements"),
+    ("\n\n CURRENT INFORMATION ABOUT SJSU TUITION:", web_tool.get_current_information, "SJSU tuition fees"),
+    ("\n\n RECENT SJSU NEWS:", web_tool.search_news, "SJSU"),
+ )
 
- # 3. Current information
- print("\n\n CURRENT INFORMATION ABOUT SJSU TUITION:")
- result = web_tool.get_current_information("SJSU tuition fees")
- print(result)
+ # The searches are independent network calls, so issue them all at once
+ # and print the results in their original order
+ with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+    futures = {heading: executor.submit(search, arg) for heading, search, arg in searches}
 
- # 4. News search
- print("\n\n RECENT SJSU NEWS:")
- result = web_tool.search_news("SJSU")
- print(result)
+    for heading, _, _ in searches:
+       emit(heading)
+       emit(futures[heading].result())
 
 
-def demo_combined_query():
+@collected_output
+def demo_combined_query(emit):
  """Demonstrate how tools complement each other"""
- print_section("COMBINED QUERY DEMO")
+ print_section(emit, "COMBINED QUERY DEMO")
 
- db_tool = DatabaseTool('./data/sjsu_database.db')
- web_tool = WebSearchTool(max_results=2)
+ db_tool = get_db_tool()
+ web_tool = get_web_tool()
 
  query = "What are the admission requirements for Computer Science?"
 
- print(f"USER QUERY: {query}\n")
+ emit(f"USER QUERY: {query}\n")
+
+ # Start the web search first so it overlaps with the database lookup
+ with ThreadPoolExecutor(max_workers=1) as executor:
+    web_future = executor.submit(
+       web_tool.search_sjsu_site, "Computer Science admission requirements 2025", max_results=2
+    )
+    db_result = db_tool.get_admission_requirements("Computer Science")
+
+    emit("1. CHECKING DATABASE (Static Information):")
+    emit(db_result)
 
- print("1. CHECKING DATABASE (Static Information):")
- db_result = db_tool.get_admission_requirements("Computer Science")
- print(db_result)
+    emit("\n\n2. CHECKING WEB (Current Information):")
+    emit(web_future.result())
 
- print("\n\n2. CHECKING WEB (Current Information):")
- web_result = web_tool.search_sjsu_site("Computer Science admission requirements 2025")
- print(web_result)
+ emit("\n\nINSIGHT: INSIGHT:")
+ emit("The DATABASE provides structured, reliable baseline requirements.")
+ emit("The WEB SEARCH provides current updates, deadlines, and application details.")
+ emit("Together, they provide a complete answer!")
 
- print("\n\nINSIGHT: INSIGHT:")
- print("The DATABASE provides structured, reliable baseline requirements.")
- print("The WEB SEARCH provides current updates, deadlines, and application details.")
- print("Together, they provide a complete answer!")
+
+async def run_demos():
+ """Run the demo sections concurrently and return their output in display order"""
+ loop = asyncio.get_running_loop()
+ # The database sections share one SQLite connection, so they run back to back
+ # on one worker while the network-bound web search section runs alongside them
+ database_lane = loop.run_in_executor(
+    None, lambda: (demo_database_tool(), demo_combined_query())
+ )
+ web_lane = loop.run_in_executor(None, demo_web_search_tool)
+ (database_output, combined_output), web_output = await asyncio.gather(database_lane, web_lane)
+ return database_output, web_output, combined_output
 
 
 def main():
@@ -118,14 +172,9 @@ def main():
  print("\n SJSU VIRTUAL ASSISTANT - TOOLS DEMO")
 
  try:
-    # Demo database tool
-    demo_database_tool()
-
-    # Demo web search tool
-    demo_web_search_tool()
-
-    # Demo combined usage
-    demo_combined_query()
+    # Demo database tool, web search tool and combined usage
+    for output in asyncio.run(run_demos()):
+       sys.stdout.write(output)
 
     print("\n DEMO COMPLETE\n")
 
@@ -2,18 +2,65 @@
 Comprehensive Analysis of Model Evaluation Results
 """
 
+import hashlib
 import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from functools import lru_cache
 from typing import Dict, List, Any
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+try:
+    import orjson  # Faster parser for large comparison files
+except ImportError:
+    orjson = None
 import numpy as np
 from pathlib import Path
 
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+
+# The rcParams seaborn's "whitegrid" style changes from matplotlib's defaults
+WHITEGRID_STYLE = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': '.8',
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'text.color': '.15',
+    'xtick.bottom': False,
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'ytick.left': False,
+}
+
+
+@lru_cache(maxsize=None)
+def _pyplot():
+    """Import and style pyplot on first use so text-only runs skip the plotting stack"""
+    import matplotlib
+    matplotlib.use('Agg')  # Figures are only saved to disk, so skip GUI backend setup
+    import matplotlib.pyplot as plt
+    
+    # Set style
+    plt.rcParams.update(WHITEGRID_STYLE)
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+    return plt
+
+
+def __getattr__(name: str):
+    """Keep `plt` importable from this module without loading it eagerly"""
+    if name == 'plt':
+        return _pyplot()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# pyplot figure label reused by every analysis plot
+ANALYSIS_FIGURE = 'analysis'
 
 
 class ResultsAnalyzer:
@@ -21,84 +68,136 @@ class ResultsAnalyzer:
     
     def __init__(self, comparison_file: str):
         """Load comparison results"""
-        with open(comparison_file, 'r') as f:
-            self.data = json.load(f)
+        with open(comparison_file, 'rb') as f:
+            raw = f.read()
+        self.data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        # Content hash of the input; outputs rendered from it are not redrawn
+        self._signature = hashlib.blake2b(raw, digest_size=16).hexdigest()
         
         self.mistral = self.data['mistral']
         self.llama = self.data['llama']
         self.detailed = self.data['detailed_comparison']
+        self._avg_m = self.mistral['averages']
+        self._avg_l = self.llama['averages']
+        
+        # Per-query series, extracted once and shared by the summary and plots
+        detailed = self.detailed
+        count = len(detailed)
+        self._query_ids = [item['query_id'] for item in detailed]
+        self._mistral_times = np.fromiter((item['mistral']['time'] for item in detailed), dtype=np.float64, count=count)
+        self._llama_times = np.fromiter((item['llama']['time'] for item in detailed), dtype=np.float64, count=count)
+        self._mistral_comp = np.fromiter((item['mistral']['completeness'] for item in detailed), dtype=np.float64, count=count)
+        self._llama_comp = np.fromiter((item['llama']['completeness'] for item in detailed), dtype=np.float64, count=count)
+        
+        # A completeness of 0.0 marks a query that hit the iteration limit
+        self._mistral_timeouts = int(np.count_nonzero(self._mistral_comp == 0.0))
+        self._llama_timeouts = int(np.count_nonzero(self._llama_comp == 0.0))
+        
+        # Per-category averages, aligned to the sorted categories both models share
+        m_cats, l_cats = self.mistral['by_category'], self.llama['by_category']
+        self._common_categories = sorted(m_cats.keys() & l_cats.keys())
+        n_cats = len(self._common_categories)
+        self._cat_m_time = np.fromiter((m_cats[c]['avg_time'] for c in self._common_categories), dtype=np.float64, count=n_cats)
+        self._cat_l_time = np.fromiter((l_cats[c]['avg_time'] for c in self._common_categories), dtype=np.float64, count=n_cats)
+        self._cat_m_comp = np.fromiter((m_cats[c]['avg_completeness'] for c in self._common_categories), dtype=np.float64, count=n_cats)
+        self._cat_l_comp = np.fromiter((l_cats[c]['avg_completeness'] for c in self._common_categories), dtype=np.float64, count=n_cats)
+        self._cat_x = np.arange(n_cats)
+        self._cat_tick_labels = [cat.replace('_', '\n') for cat in self._common_categories]
+        
+        self._best_mistral_category = self._best_category(self.mistral['by_category'])
+        self._best_llama_category = self._best_category(self.llama['by_category'])
         
         # Create output directory
         self.output_dir = Path(comparison_file).parent / "analysis"
         self.output_dir.mkdir(exist_ok=True)
+        
+        # Resolution of the saved PNGs; set ANALYSIS_DPI=300 for print quality
+        self.dpi = int(os.environ.get('ANALYSIS_DPI', '150'))
+    
+    @staticmethod
+    def _best_category(by_category: Dict[str, Dict[str, float]]):
+        """Return the (category, stats) pair with the highest average completeness"""
+        items = list(by_category.items())
+        scores = np.fromiter((stats['avg_completeness'] for _, stats in items), dtype=np.float64, count=len(items))
+        return items[int(scores.argmax())]
     
-    def print_summary(self):
-        """Print comprehensive text summary"""
-        print("SJSU VIRTUAL ASSISTANT - MODEL COMPARISON ANALYSIS")
-        print()
-        
-        print("OVERALL PERFORMANCE METRICS")
-        print(f"{'Metric':<30} {'Mistral-7B':>20} {'Llama-3.2-11B':>20}")
-        print(f"{'Average Response Time':<30} {self.mistral['averages']['response_time']:>18.2f}s {self.llama['averages']['response_time']:>18.2f}s")
-        print(f"{'Completeness Score':<30} {self.mistral['averages']['completeness_score']:>20.2f} {self.llama['averages']['completeness_score']:>20.2f}")
-        print(f"{'Relevance Score':<30} {self.mistral['averages']['relevance_score']:>20.2f} {self.llama['averages']['relevance_score']:>20.2f}")
-        print(f"{'Avg Response Length (words)':<30} {self.mistral['averages']['response_length_words']:>20.0f} {self.llama['averages']['response_length_words']:>20.0f}")
-        print(f"{'Injection Defense Rate':<30} {self.mistral['security']['injection_defense_rate']:>20.1%} {self.llama['security']['injection_defense_rate']:>20.1%}")
-        print()
-        
-        print("WINNERS")
-        speed_diff = abs(self.mistral['averages']['response_time'] - self.llama['averages']['response_time'])
-        speed_pct = (speed_diff / max(self.mistral['averages']['response_time'], self.llama['averages']['response_time'])) * 100
-        print(f"Speed: Llama-3.2-11B ({speed_pct:.1f}% faster)")
-        
-        comp_diff = abs(self.mistral['averages']['completeness_score'] - self.llama['averages']['completeness_score'])
-        comp_pct = (comp_diff / max(self.mistral['averages']['completeness_score'], 0.01)) * 100
-        print(f"Completeness: Mistral-7B ({comp_pct:.1f}% higher score)")
-        
-        rel_diff = abs(self.mistral['averages']['relevance_score'] - self.llama['averages']['relevance_score'])
-        rel_pct = (rel_diff / max(self.mistral['averages']['relevance_score'], 0.01)) * 100
-        print(f"Relevance: Mistral-7B ({rel_pct:.1f}% higher score)")
-        print()
-        
-        print("PERFORMANCE BY CATEGORY")
-        
-        # Get all categories
-        categories = set(self.mistral['by_category'].keys()) | set(self.llama['by_category'].keys())
-        
-        for cat in sorted(categories):
-            if cat in self.mistral['by_category'] and cat in self.llama['by_category']:
-                m_data = self.mistral['by_category'][cat]
-                l_data = self.llama['by_category'][cat]
-                
-                print(f"\n{cat.upper().replace('_', ' ')}")
-                print(f"  Mistral: {m_data['avg_time']:.1f}s | Completeness: {m_data['avg_completeness']:.2f}")
-                print(f"  Llama: {l_data['avg_time']:.1f}s | Completeness: {l_data['avg_completeness']:.2f}")
-        
-        print()
-        print("KEY INSIGHTS")
+    def print_summary(self, file=None):
+        """
+        Print comprehensive text summary
+        
+        Args:
+            file: Stream to write the summary to (defaults to sys.stdout)
+        """
+        ma, la = self._avg_m, self._avg_l
+        ms, ls = self.mistral['security'], self.llama['security']
+        m_cats, l_cats = self.mistral['by_category'], self.llama['by_category']
+        
+        # Collect the report and write it in one call
+        lines = []
+        lines.append("SJSU VIRTUAL ASSISTANT - MODEL COMPARISON ANALYSIS")
+        lines.append("")
+        
+        lines.append("OVERALL PERFORMANCE METRICS")
+        lines.append(f"{'Metric':<30} {'Mistral-7B':>20} {'Llama-3.2-11B':>20}")
+        lines.append(f"{'Average Response Time':<30} {ma['response_time']:>18.2f}s {la['response_time']:>18.2f}s")
+        lines.append(f"{'Completeness Score':<30} {ma['completeness_score']:>20.2f} {la['completeness_score']:>20.2f}")
+        lines.append(f"{'Relevance Score':<30} {ma['relevance_score']:>20.2f} {la['relevance_score']:>20.2f}")
+        lines.append(f"{'Avg Response Length (words)':<30} {ma['response_length_words']:>20.0f} {la['response_length_words']:>20.0f}")
+        lines.append(f"{'Injection Defense Rate':<30} {ms['injection_defense_rate']:>20.1%} {ls['injection_defense_rate']:>20.1%}")
+        lines.append("")
+        
+        lines.append("WINNERS")
+        speed_diff = abs(ma['response_time'] - la['response_time'])
+        speed_pct = (speed_diff / max(ma['response_time'], la['response_time'])) * 100
+        lines.append(f"Speed: Llama-3.2-11B ({speed_pct:.1f}% faster)")
+        
+        comp_diff = abs(ma['completeness_score'] - la['completeness_score'])
+        comp_pct = (comp_diff / max(ma['completeness_score'], 0.01)) * 100
+        lines.append(f"Completeness: Mistral-7B ({comp_pct:.1f}% higher score)")
+        
+        rel_diff = abs(ma['relevance_score'] - la['relevance_score'])
+        rel_pct = (rel_diff / max(ma['relevance_score'], 0.01)) * 100
+        lines.append(f"Relevance: Mistral-7B ({rel_pct:.1f}% higher score)")
+        lines.append("")
+        
+        lines.append("PERFORMANCE BY CATEGORY")
+        
+        # Categories both models were evaluated on
+        for cat in self._common_categories:
+            m_data = m_cats[cat]
+            l_data = l_cats[cat]
+            
+            lines.append(f"\n{cat.upper().replace('_', ' ')}")
+            lines.append(f"  Mistral: {m_data['avg_time']:.1f}s | Completeness: {m_data['avg_completeness']:.2f}")
+            lines.append(f"  Llama: {l_data['avg_time']:.1f}s | Completeness: {l_data['avg_completeness']:.2f}")
+        
+        lines.append("")
+        lines.append("KEY INSIGHTS")
         
         # Analyze patterns
         insights = self._generate_insights()
         for i, insight in enumerate(insights, 1):
-            print(f"{i}. {insight}")
+            lines.append(f"{i}. {insight}")
         
-        print()
+        lines.append("")
+        
+        (file or sys.stdout).write("\n".join(lines) + "\n")
     
     def _generate_insights(self) -> List[str]:
         """Generate key insights from the data"""
         insights = []
         
         # Speed analysis
-        if self.llama['averages']['response_time'] < self.mistral['averages']['response_time']:
+        if self._avg_l['response_time'] < self._avg_m['response_time']:
             insights.append("Llama-3.2-11B is consistently faster despite being a larger model (11B vs 7B parameters)")
         
         # Completeness analysis
-        if self.mistral['averages']['completeness_score'] > self.llama['averages']['completeness_score']:
+        if self._avg_m['completeness_score'] > self._avg_l['completeness_score']:
             insights.append("Mistral-7B provides more complete answers, better covering expected information")
         
         # Timeout analysis
-        mistral_timeouts = sum(1 for item in self.detailed if item['mistral']['completeness'] == 0.0)
-        llama_timeouts = sum(1 for item in self.detailed if item['llama']['completeness'] == 0.0)
+        mistral_timeouts, llama_timeouts = self._mistral_timeouts, self._llama_timeouts
         
         if mistral_timeouts > 5 or llama_timeouts > 5:
             insights.append(f"High iteration timeout rate detected (Mistral: {mistral_timeouts}/20, Llama: {llama_timeouts}/20) - suggests agent needs tuning")
@@ -108,192 +207,194 @@ class ResultsAnalyzer:
             insights.append("Both models successfully defended against prompt injection attacks (100% defense rate)")
         
         # Category strengths
-        best_mistral = max(self.mistral['by_category'].items(), key=lambda x: x[1]['avg_completeness'])
-        best_llama = max(self.llama['by_category'].items(), key=lambda x: x[1]['avg_completeness'])
+        best_mistral = self._best_mistral_category
+        best_llama = self._best_llama_category
         
         insights.append(f"Mistral excels at {best_mistral[0].replace('_', ' ')} queries (completeness: {best_mistral[1]['avg_completeness']:.2f})")
         insights.append(f"Llama excels at {best_llama[0].replace('_', ' ')} queries (completeness: {best_llama[1]['avg_completeness']:.2f})")
         
         # Response length
-        if self.mistral['averages']['response_length_words'] > self.llama['averages']['response_length_words'] * 1.5:
+        if self._avg_m['response_length_words'] > self._avg_l['response_length_words'] * 1.5:
             insights.append("Mistral generates significantly longer responses (potential verbosity issue)")
         
         return insights
     
-    def create_visualizations(self):
-        """Create comprehensive visualizations"""
-        print("\nCreating visualizations...")
-        
-        # 1. Overall metrics comparison
-        self._plot_overall_metrics()
-        
-        # 2. Response time by category
-        self._plot_time_by_category()
-        
-        # 3. Completeness by category
-        self._plot_completeness_by_category()
-        
-        # 4. Query-by-query comparison
-        self._plot_query_comparison()
+    def create_visualizations(self, force: bool = False):
+        """
+        Create comprehensive visualizations
+        
+        Args:
+            force: Redraw even if the saved figures already match this input
+        """
+        plots = [
+            (self._plot_overall_metrics, '1_overall_metrics.png'),  # 1. Overall metrics comparison
+            (self._plot_time_by_category, '2_time_by_category.png'),  # 2. Response time by category
+            (self._plot_completeness_by_category, '3_completeness_by_category.png'),  # 3. Completeness by category
+            (self._plot_query_comparison, '4_query_comparison.png'),  # 4. Query-by-query comparison
+            (self._plot_speed_vs_completeness, '5_speed_vs_completeness.png'),  # 5. Speed vs Completeness scatter
+        ]
+        
+        # Figures depend on the DPI as well as the input data
+        signature = f"{self._signature}-{self.dpi}"
+        filenames = [filename for _, filename in plots]
+        if not force and self._is_current('plots', signature, filenames):
+            print(f"\nVisualizations are up to date in: {self.output_dir}")
+            return
         
-        # 5. Speed vs Completeness scatter
-        self._plot_speed_vs_completeness()
+        print("\nCreating visualizations...")
         
+        # Each figure is rendered and saved independently, so draw them in
+        # separate processes; result() re-raises any plotting error here
+        workers = min(len(plots), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(plot, filename) for plot, filename in plots]:
+                    future.result()
+        else:
+            for plot, filename in plots:
+                plot(filename)
+            _pyplot().close(ANALYSIS_FIGURE)
+        
+        self._mark_current('plots', signature)
         print(f"All visualizations saved to: {self.output_dir}")
     
-    def _plot_overall_metrics(self):
+    def _plot_overall_metrics(self, filename: str):
         """Plot overall metric comparison"""
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        ma, la = self._avg_m, self._avg_l
+        fig = self._figure(14, 10)
+        axes = fig.subplots(2, 2)
         fig.suptitle('Overall Model Comparison', fontsize=16, fontweight='bold')
         
         models = ['Mistral-7B', 'Llama-3.2-11B']
         colors = ['#FF6B6B', '#4ECDC4']
         
         # Response time
-        times = [self.mistral['averages']['response_time'], self.llama['averages']['response_time']]
-        axes[0, 0].bar(models, times, color=colors, alpha=0.7, edgecolor='black')
+        times = [ma['response_time'], la['response_time']]
+        bars = axes[0, 0].bar(models, times, color=colors, alpha=0.7, edgecolor='black')
         axes[0, 0].set_ylabel('Seconds')
         axes[0, 0].set_title('Average Response Time (Lower is Better)')
         axes[0, 0].set_ylim(0, max(times) * 1.2)
-        for i, v in enumerate(times):
-            axes[0, 0].text(i, v + 1, f'{v:.1f}s', ha='center', fontweight='bold')
+        axes[0, 0].bar_label(bars, fmt='%.1fs', fontweight='bold', padding=3)
         
         # Completeness
-        completeness = [self.mistral['averages']['completeness_score'], self.llama['averages']['completeness_score']]
-        axes[0, 1].bar(models, completeness, color=colors, alpha=0.7, edgecolor='black')
+        completeness = [ma['completeness_score'], la['completeness_score']]
+        bars = axes[0, 1].bar(models, completeness, color=colors, alpha=0.7, edgecolor='black')
         axes[0, 1].set_ylabel('Score')
         axes[0, 1].set_title('Average Completeness Score (Higher is Better)')
         axes[0, 1].set_ylim(0, 1)
-        for i, v in enumerate(completeness):
-            axes[0, 1].text(i, v + 0.02, f'{v:.2f}', ha='center', fontweight='bold')
+        axes[0, 1].bar_label(bars, fmt='%.2f', fontweight='bold', padding=3)
         
         # Relevance
-        relevance = [self.mistral['averages']['relevance_score'], self.llama['averages']['relevance_score']]
-        axes[1, 0].bar(models, relevance, color=colors, alpha=0.7, edgecolor='black')
+        relevance = [ma['relevance_score'], la['relevance_score']]
+        bars = axes[1, 0].bar(models, relevance, color=colors, alpha=0.7, edgecolor='black')
         axes[1, 0].set_ylabel('Score')
         axes[1, 0].set_title('Average Relevance Score (Higher is Better)')
         axes[1, 0].set_ylim(0, 1)
-        for i, v in enumerate(relevance):
-            axes[1, 0].text(i, v + 0.02, f'{v:.2f}', ha='center', fontweight='bold')
+        axes[1, 0].bar_label(bars, fmt='%.2f', fontweight='bold', padding=3)
         
         # Response length
-        lengths = [self.mistral['averages']['response_length_words'], self.llama['averages']['response_length_words']]
-        axes[1, 1].bar(models, lengths, color=colors, alpha=0.7, edgecolor='black')
+        lengths = [ma['response_length_words'], la['response_length_words']]
+        bars = axes[1, 1].bar(models, lengths, color=colors, alpha=0.7, edgecolor='black')
         axes[1, 1].set_ylabel('Words')
         axes[1, 1].set_title('Average Response Length')
-        for i, v in enumerate(lengths):
-            axes[1, 1].text(i, v + 1, f'{int(v)}', ha='center', fontweight='bold')
+        axes[1, 1].bar_label(bars, fmt='%d', fontweight='bold', padding=3)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / '1_overall_metrics.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, filename)
     
-    def _plot_time_by_category(self):
+    def _plot_time_by_category(self, filename: str):
         """Plot response time by category"""
-        categories = sorted(set(self.mistral['by_category'].keys()) & set(self.llama['by_category'].keys()))
-        
-        mistral_times = [self.mistral['by_category'][cat]['avg_time'] for cat in categories]
-        llama_times = [self.llama['by_category'][cat]['avg_time'] for cat in categories]
-        
-        x = np.arange(len(categories))
-        width = 0.35
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.bar(x - width/2, mistral_times, width, label='Mistral-7B', color='#FF6B6B', alpha=0.7)
-        ax.bar(x + width/2, llama_times, width, label='Llama-3.2-11B', color='#4ECDC4', alpha=0.7)
-        
-        ax.set_xlabel('Category')
-        ax.set_ylabel('Average Response Time (seconds)')
-        ax.set_title('Response Time by Query Category')
-        ax.set_xticks(x)
-        ax.set_xticklabels([cat.replace('_', '\n') for cat in categories])
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / '2_time_by_category.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._plot_category_bars(
+            self._cat_m_time, self._cat_l_time, filename,
+            ylabel='Average Response Time (seconds)',
+            title='Response Time by Query Category'
+        )
     
-    def _plot_completeness_by_category(self):
+    def _plot_completeness_by_category(self, filename: str):
         """Plot completeness by category"""
-        categories = sorted(set(self.mistral['by_category'].keys()) & set(self.llama['by_category'].keys()))
-        
-        mistral_comp = [self.mistral['by_category'][cat]['avg_completeness'] for cat in categories]
-        llama_comp = [self.llama['by_category'][cat]['avg_completeness'] for cat in categories]
-        
-        x = np.arange(len(categories))
+        self._plot_category_bars(
+            self._cat_m_comp, self._cat_l_comp, filename,
+            ylabel='Average Completeness Score',
+            title='Completeness Score by Query Category',
+            ylim=(0, 1)
+        )
+    
+    def _plot_category_bars(self, mistral_values, llama_values, filename: str,
+                            ylabel: str, title: str, ylim=None):
+        """
+        Plot a grouped bar chart of both models over the shared categories
+        
+        Args:
+            mistral_values: Mistral value per category, in _common_categories order
+            llama_values: Llama value per category, in _common_categories order
+            filename: Output PNG name
+            ylabel: Y-axis label
+            title: Chart title
+            ylim: Optional (min, max) for the y-axis
+        """
+        x = self._cat_x
         width = 0.35
         
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.bar(x - width/2, mistral_comp, width, label='Mistral-7B', color='#FF6B6B', alpha=0.7)
-        ax.bar(x + width/2, llama_comp, width, label='Llama-3.2-11B', color='#4ECDC4', alpha=0.7)
+        fig = self._figure(12, 6)
+        ax = fig.subplots()
+        ax.bar(x - width/2, mistral_values, width, label='Mistral-7B', color='#FF6B6B', alpha=0.7)
+        ax.bar(x + width/2, llama_values, width, label='Llama-3.2-11B', color='#4ECDC4', alpha=0.7)
         
         ax.set_xlabel('Category')
-        ax.set_ylabel('Average Completeness Score')
-        ax.set_title('Completeness Score by Query Category')
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
         ax.set_xticks(x)
-        ax.set_xticklabels([cat.replace('_', '\n') for cat in categories])
+        ax.set_xticklabels(self._cat_tick_labels)
         ax.legend()
-        ax.set_ylim(0, 1)
+        if ylim is not None:
+            ax.set_ylim(*ylim)
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / '3_completeness_by_category.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, filename)
     
-    def _plot_query_comparison(self):
+    def _plot_query_comparison(self, filename: str):
         """Plot query-by-query comparison"""
-        query_ids = [item['query_id'] for item in self.detailed]
-        mistral_times = [item['mistral']['time'] for item in self.detailed]
-        llama_times = [item['llama']['time'] for item in self.detailed]
+        fig = self._figure(14, 10)
+        # Both panels use the same query axis, so it is laid out once on the bottom panel
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+        x = np.arange(len(self._query_ids))
+        width = 0.35
         
         # Response times
-        x = np.arange(len(query_ids))
-        width = 0.35
-        ax1.bar(x - width/2, mistral_times, width, label='Mistral-7B', color='#FF6B6B', alpha=0.7)
-        ax1.bar(x + width/2, llama_times, width, label='Llama-3.2-11B', color='#4ECDC4', alpha=0.7)
-        ax1.set_xlabel('Query ID')
+        ax1.bar(x - width/2, self._mistral_times, width, label='Mistral-7B', color='#FF6B6B', alpha=0.7)
+        ax1.bar(x + width/2, self._llama_times, width, label='Llama-3.2-11B', color='#4ECDC4', alpha=0.7)
         ax1.set_ylabel('Response Time (seconds)')
         ax1.set_title('Response Time per Query')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(query_ids, rotation=45, ha='right')
         ax1.legend()
         ax1.grid(axis='y', alpha=0.3)
         
         # Completeness scores
-        mistral_comp = [item['mistral']['completeness'] for item in self.detailed]
-        llama_comp = [item['llama']['completeness'] for item in self.detailed]
-        
-        ax2.bar(x - width/2, mistral_comp, width, label='Mistral-7B', color='#FF6B6B', alpha=0.7)
-        ax2.bar(x + width/2, llama_comp, width, label='Llama-3.2-11B', color='#4ECDC4', alpha=0.7)
+        ax2.bar(x - width/2, self._mistral_comp, width, label='Mistral-7B', color='#FF6B6B', alpha=0.7)
+        ax2.bar(x + width/2, self._llama_comp, width, label='Llama-3.2-11B', color='#4ECDC4', alpha=0.7)
         ax2.set_xlabel('Query ID')
         ax2.set_ylabel('Completeness Score')
         ax2.set_title('Completeness Score per Query')
         ax2.set_xticks(x)
-        ax2.set_xticklabels(query_ids, rotation=45, ha='right')
+        ax2.set_xticklabels(self._query_ids, rotation=45, ha='right')
         ax2.legend()
         ax2.set_ylim(0, 1)
         ax2.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / '4_query_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, filename)
     
-    def _plot_speed_vs_completeness(self):
+    def _plot_speed_vs_completeness(self, filename: str):
         """Plot speed vs completeness scatter"""
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig = self._figure(10, 8)
+        ax = fig.subplots()
         
         # Mistral data points
-        mistral_times = [item['mistral']['time'] for item in self.detailed]
-        mistral_comp = [item['mistral']['completeness'] for item in self.detailed]
-        ax.scatter(mistral_times, mistral_comp, s=100, alpha=0.6, color='#FF6B6B', label='Mistral-7B', edgecolors='black')
+        ax.scatter(self._mistral_times, self._mistral_comp, s=100, alpha=0.6, color='#FF6B6B', label='Mistral-7B', edgecolors='black')
         
         # Llama data points
-        llama_times = [item['llama']['time'] for item in self.detailed]
-        llama_comp = [item['llama']['completeness'] for item in self.detailed]
-        ax.scatter(llama_times, llama_comp, s=100, alpha=0.6, color='#4ECDC4', label='Llama-3.2-11B', edgecolors='black')
+        ax.scatter(self._llama_times, self._llama_comp, s=100, alpha=0.6, color='#4ECDC4', label='Llama-3.2-11B', edgecolors='black')
         
         ax.set_xlabel('Response Time (seconds)')
         ax.set_ylabel('Completeness Score')
@@ -306,35 +407,59 @@ class ResultsAnalyzer:
         ax.axhline(y=0.7, color='green', linestyle='--', alpha=0.3, label='Good completeness threshold')
         ax.axvline(x=60, color='orange', linestyle='--', alpha=0.3, label='Fast response threshold')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / '5_speed_vs_completeness.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, filename)
+    
+    def _is_current(self, name: str, signature: str, filenames: List[str]) -> bool:
+        """Check whether outputs were last written from the same input signature"""
+        sig_path = self.output_dir / f".{name}.sig"
+        if not sig_path.exists() or sig_path.read_text() != signature:
+            return False
+        return all((self.output_dir / filename).exists() for filename in filenames)
+    
+    def _mark_current(self, name: str, signature: str):
+        """Record the input signature the outputs were written from"""
+        (self.output_dir / f".{name}.sig").write_text(signature)
+    
+    def _figure(self, width: float, height: float):
+        """Return the shared analysis figure, cleared and resized for the next plot"""
+        # Reusing one figure keeps its Agg canvas instead of allocating a new one per plot
+        fig = _pyplot().figure(num=ANALYSIS_FIGURE, clear=True)
+        fig.set_size_inches(width, height)
+        fig.set_dpi(self.dpi)
+        return fig
+    
+    def _save_figure(self, fig, filename: str):
+        """Save a figure to the output directory as PNG"""
+        # tight_layout() already fits the artists, so render once straight to PNG
+        # rather than through savefig's bbox_inches='tight' measuring pass;
+        # compress_level=1 trades slightly larger PNGs for much faster encoding
+        fig.canvas.print_png(str(self.output_dir / filename), pil_kwargs={'compress_level': 1})
     
     def generate_recommendations(self) -> List[Dict[str, Any]]:
         """Generate recommendations based on analysis"""
         recommendations = []
         
         # Speed recommendation
-        if self.llama['averages']['response_time'] < self.mistral['averages']['response_time'] * 0.7:
+        if self._avg_l['response_time'] < self._avg_m['response_time'] * 0.7:
             recommendations.append({
                 'priority': 'HIGH',
                 'category': 'Performance',
                 'recommendation': 'Use Llama-3.2-11B for production - significantly faster response times',
-                'rationale': f"Llama is {((self.mistral['averages']['response_time'] / self.llama['averages']['response_time']) - 1) * 100:.1f}% faster on average"
+                'rationale': f"Llama is {((self._avg_m['response_time'] / self._avg_l['response_time']) - 1) * 100:.1f}% faster on average"
             })
         
         # Quality recommendation
-        if self.mistral['averages']['completeness_score'] > self.llama['averages']['completeness_score'] + 0.1:
+        if self._avg_m['completeness_score'] > self._avg_l['completeness_score'] + 0.1:
             recommendations.append({
                 'priority': 'MEDIUM',
                 'category': 'Quality',
                 'recommendation': 'Consider Mistral-7B for applications requiring high completeness',
-                'rationale': f"Mistral provides {((self.mistral['averages']['completeness_score'] / self.llama['averages']['completeness_score']) - 1) * 100:.1f}% better completeness"
+                'rationale': f"Mistral provides {((self._avg_m['completeness_score'] / self._avg_l['completeness_score']) - 1) * 100:.1f}% better completeness"
             })
         
         # Timeout recommendation
-        mistral_timeouts = sum(1 for item in self.detailed if item['mistral']['completeness'] == 0.0)
-        llama_timeouts = sum(1 for item in self.detailed if item['llama']['completeness'] == 0.0)
+        mistral_timeouts = self._mistral_timeouts
         
         if mistral_timeouts > 5:
             recommendations.append({
@@ -346,37 +471,42 @@ class ResultsAnalyzer:
         
         return recommendations
     
-    def print_recommendations(self):
-        """Print recommendations"""
-        print("\nRECOMMENDATIONS")
+    def print_recommendations(self, file=None):
+        """
+        Print recommendations
+        
+        Args:
+            file: Stream to write the recommendations to (defaults to sys.stdout)
+        """
+        lines = ["\nRECOMMENDATIONS"]
         
         recommendations = self.generate_recommendations()
         
         for i, rec in enumerate(recommendations, 1):
-            print(f"\n{i}. [{rec['priority']}] {rec['category']}")
-            print(f"   {rec['recommendation']}")
-            print(f"   Rationale: {rec['rationale']}")
+            lines.append(f"\n{i}. [{rec['priority']}] {rec['category']}")
+            lines.append(f"   {rec['recommendation']}")
+            lines.append(f"   Rationale: {rec['rationale']}")
         
-    def save_report(self):
-        """Save comprehensive text report"""
-        report_path = self.output_dir / "analysis_report.txt"
+        (file or sys.stdout).write("\n".join(lines) + "\n")
         
-        import sys
-        from io import StringIO
+    def save_report(self, force: bool = False):
+        """
+        Save comprehensive text report
         
-        # Capture print output
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        
-        self.print_summary()
-        self.print_recommendations()
-        
-        report_content = sys.stdout.getvalue()
-        sys.stdout = old_stdout
+        Args:
+            force: Rewrite the report even if it already matches this input
+        """
+        report_path = self.output_dir / "analysis_report.txt"
+        if not force and self._is_current('report', self._signature, [report_path.name]):
+            print(f"\nAnalysis report is up to date: {report_path}")
+            return
         
-        # Save to file
+        # Write each section straight to the report file
         with open(report_path, 'w') as f:
-            f.write(report_content)
+            self.print_summary(file=f)
+            self.print_recommendations(file=f)
+        
+        self._mark_current('report', self._signature)
         
         print(f"\nAnalysis report saved to: {report_path}")
 
@@ -390,24 +520,30 @@ def main():
         print("No comparison files found in evaluation/results/")
         return
     
-    comparison_files = list(results_dir.glob("*comparison*.json"))
+    comparison_files = [
+        path for path in results_dir.iterdir()
+        if fnmatch(path.name, "*comparison*.json")
+    ]
     
     if not comparison_files:
         print("No comparison files found in evaluation/results/")
         return
     
-    # Use the most recent comparison file
-    comparison_file = sorted(comparison_files)[-1]
+    # Use the most recently written comparison file
+    comparison_file = max(comparison_files, key=lambda path: path.stat().st_mtime)
     print(f"Analyzing: {comparison_file}")
     
     # Create analyzer
     analyzer = ResultsAnalyzer(str(comparison_file))
     
     # Generate analysis
+    # --force redraws figures and the report even if the input is unchanged
+    force = '--force' in sys.argv[1:]
+    
     analyzer.print_summary()
-    analyzer.create_visualizations()
+    analyzer.create_visualizations(force=force)
     analyzer.print_recommendations()
-    analyzer.save_report()
+    analyzer.save_report(force=force)
     
     print("\nAnalysis complete!")
     print(f"Results saved to: {analyzer.output_dir}")
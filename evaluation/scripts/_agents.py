@@ -0,0 +1,70 @@
+"""
+Shared agents for the evaluation scripts
+Builds each agent once per process instead of on every evaluation run
+"""
+
+from functools import lru_cache
+
+from src.agent import agent_orchestrator
+
+
+@lru_cache(maxsize=None)
+def get_agent(model_type: str, use_groq: bool = None, slot: int = 0):
+    """
+    Get the agent for one worker slot, building it on first use
+
+    Concurrent queries each take a different slot so no agent is used by two
+    threads at once. Agents are reused across evaluation runs, so callers
+    reset_agent before each query to keep earlier queries out of its history.
+
+    Args:
+        model_type: Model to use ('mistral' or 'llama')
+        use_groq: Use the Groq API instead of a local model (None keeps the agent's default)
+        slot: Worker slot within the evaluation's agent pool
+    """
+    # Looked up on first use, so importing this module for get_orchestrator
+    # does not depend on it
+    SJSUAgent = agent_orchestrator.SJSUAgent
+    if use_groq is None:
+        return SJSUAgent(model_type=model_type, verbose=False)
+    return SJSUAgent(model_type=model_type, use_groq=use_groq, verbose=False)
+
+
+@lru_cache(maxsize=None)
+def get_orchestrator(model_name: str, max_iterations: int = 10, slot: int = 0):
+    """
+    Get an orchestrator for a local Ollama model, building it on first use
+
+    Orchestrators share one DatabaseManager, so evaluations run one after
+    another in a process reuse the open database and the model client.
+    As with get_agent, concurrent queries each take their own slot, since an
+    orchestrator keeps conversation history between queries; reset_agent
+    clears it before each query.
+
+    Args:
+        model_name: Ollama model name (e.g. "mistral:latest")
+        max_iterations: Maximum reasoning iterations per query
+        slot: Worker slot within the evaluation's orchestrator pool
+    """
+    # Imported here so the API-backed evaluators don't load the local model stack
+    from src.database.db_manager import get_db_manager
+    from src.llm.ollama_model import OllamaClient
+
+    return agent_orchestrator.AgentOrchestrator(
+        llm_client=OllamaClient(model_name=model_name),
+        db_manager=get_db_manager(),
+        max_iterations=max_iterations
+    )
+
+
+def reset_agent(agent) -> None:
+    """
+    Clear the conversation history an agent or orchestrator kept from earlier queries
+
+    Pooled agents answer queries in whatever order the workers pick them up,
+    so without this each answer would depend on which queries the agent
+    happened to see before; reset, every query starts like a fresh agent.
+    """
+    reset = getattr(agent, 'reset_conversation', None)
+    if reset is not None:
+        reset()
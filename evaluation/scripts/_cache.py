@@ -0,0 +1,75 @@
+"""
+Response cache for the evaluation scripts
+Keeps agent answers on disk so a re-run can skip the model call. Opt-in,
+since a cached answer comes back with the timing of its first run
+"""
+
+import hashlib
+import shelve
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+from evaluation.scripts._failures import failure_indicators
+from src.utils.rate_limiter import waited_seconds
+
+
+# Used only when a script runs with --cache; delete this directory to forget the answers
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+CACHE_PATH = CACHE_DIR / "responses"
+
+# shelve is not safe for concurrent use, and the evaluators query from threads
+_lock = threading.Lock()
+
+
+def cache_key(model_label: str, query: str) -> str:
+    """Key an answer by the model that gave it and the query text"""
+    return hashlib.blake2b((model_label + query).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def cached_query(
+    model_label: str,
+    query: str,
+    ask: Callable[[str], Dict[str, Any]],
+    use_cache: bool = False
+) -> Tuple[Dict[str, Any], float]:
+    """
+    Answer a query from the cache, or ask the agent and remember the answer
+
+    Args:
+        model_label: Model the answer belongs to (e.g. "llama-groq")
+        query: Query text
+        ask: Agent call returning a response dict with an 'answer'
+        use_cache: Reuse and remember answers; off, the agent is always
+            asked and the cache is left untouched. Answers showing a failure
+            (see failure_indicators) are never remembered, so they are asked again
+
+    Returns:
+        Tuple of (response dict, response time in seconds). Time spent waiting
+        on the Groq rate limit or backing off after a rejected request is left
+        out. A cached answer comes back with the response time measured when
+        it was first asked.
+    """
+    key = cache_key(model_label, query)
+    if use_cache:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with _lock, shelve.open(str(CACHE_PATH)) as cache:
+            cached = cache.get(key)
+        if cached is not None:
+            return {'answer': cached['answer'], 'cached': True}, cached['response_time']
+
+    # The agent runs on this thread, so its client's waits land in this thread's total
+    waited = waited_seconds()
+    start_time = time.perf_counter_ns()
+    response = ask(query)
+    response_time = (time.perf_counter_ns() - start_time) / 1e9 - (waited_seconds() - waited)
+
+    answer = response.get('answer', str(response))
+    if use_cache and not failure_indicators(answer):
+        with _lock, shelve.open(str(CACHE_PATH)) as cache:
+            cache[key] = {
+                'answer': answer,
+                'response_time': response_time
+            }
+    return response, response_time
@@ -0,0 +1,256 @@
+"""
+Shared evaluation loop for the evaluation scripts
+Runs one model over the test queries with pooled agents, optionally cached answers
+and a resumable result stream; each script supplies the scoring
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from evaluation.metrics import EvaluationMetrics
+from evaluation.scripts._agents import get_agent, reset_agent
+from evaluation.scripts._cache import cached_query
+from evaluation.scripts._output import ResultStream
+
+
+# Queries in flight per model: Groq serves many at once, local Mistral a couple
+GROQ_JOBS = 8
+LOCAL_JOBS = 2
+
+# Queries sent to Ollama at once. Start the server with the same
+# OLLAMA_NUM_PARALLEL (and OLLAMA_MAX_LOADED_MODELS=1) so it serves them
+# in parallel instead of queueing them
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", LOCAL_JOBS))
+
+# Asks the model one query: returns (response dict, response time in seconds)
+Ask = Callable[[str], Tuple[Dict[str, Any], float]]
+
+# Scores one query: (query_data, index, total, ask) -> result record
+Score = Callable[[Dict[str, Any], int, int, Ask], Dict[str, Any]]
+
+
+class QueryOutcome(NamedTuple):
+    """One query's result record plus what the run's statistics need from it"""
+    result: Dict[str, Any]
+    response_time: float
+    success: bool
+    # Counted towards the run's timeouts (errors are not, even if slow)
+    timeout: bool
+
+
+def print_block(lines: List[str]) -> None:
+    """
+    Print one query's output lines in a single write
+
+    Queries run on several threads, so separate prints from two queries
+    would interleave; one write keeps each query's lines together.
+    """
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+class Evaluator:
+    """Run one model over a list of queries"""
+
+    def __init__(
+        self,
+        model_type: str,
+        use_groq: bool = None,
+        label: str = None,
+        jobs: int = None,
+        use_cache: bool = False,
+        stream_file=None
+    ):
+        """
+        Build the agent pool for a model
+
+        Args:
+            model_type: Model to use ('mistral' or 'llama')
+            use_groq: Use the Groq API (None keeps the agent's default)
+            label: Name answers are cached under (default: model_type)
+            jobs: Queries run at once (default: GROQ_JOBS for Groq, LOCAL_JOBS otherwise)
+            use_cache: Reuse answers cached by earlier runs instead of measuring them again
+            stream_file: JSONL file results are appended to as they finish
+                (default: <label>.jsonl). If an interrupted run left it behind,
+                the queries it holds are skipped.
+        """
+        self.label = label or model_type
+        self.jobs = jobs or (GROQ_JOBS if use_groq else LOCAL_JOBS)
+        self.use_cache = use_cache
+        self.stream_file = stream_file or f"{self.label}.jsonl"
+        # One agent per concurrent query, so the pool also caps how many are in flight
+        self.agents = [get_agent(model_type, use_groq, slot) for slot in range(self.jobs)]
+
+    def _ask(self, agent) -> Ask:
+        """Ask through the response cache; the Groq client applies the rate limit and retries"""
+        def ask(query: str):
+            return cached_query(self.label, query, agent.query, self.use_cache)
+        return ask
+
+    async def evaluate(self, queries: List[Dict[str, Any]], score: Score) -> List[Dict[str, Any]]:
+        """
+        Score every query, running up to `jobs` at once
+
+        Args:
+            queries: Test queries
+            score: Called on a worker thread for each query with an `ask` bound
+                to a pooled agent; returns the query's result record
+
+        Returns:
+            Result records in query order
+        """
+        agents = asyncio.Queue()
+        for agent in self.agents:
+            agents.put_nowait(agent)
+
+        # gather keeps query order, so results line up across models
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor, ResultStream(self.stream_file) as stream:
+            if stream.completed:
+                print(f"Resuming: {len(stream.completed)} queries already done")
+            return list(await asyncio.gather(*(
+                self._run_one(agents, executor, stream, score, query_data, i, len(queries))
+                for i, query_data in enumerate(queries, 1)
+            )))
+
+    def run(self, queries: List[Dict[str, Any]], score: Score) -> List[Dict[str, Any]]:
+        """Blocking form of evaluate for scripts without an event loop"""
+        return asyncio.run(self.evaluate(queries, score))
+
+    async def _run_one(
+        self,
+        agents: asyncio.Queue,
+        executor: ThreadPoolExecutor,
+        stream: ResultStream,
+        score: Score,
+        query_data: Dict[str, Any],
+        i: int,
+        total: int
+    ) -> Dict[str, Any]:
+        """Score one query with an agent borrowed from the pool, recording it in the stream"""
+        done = stream.get(query_data.get('id', i))
+        if done is not None:
+            return done
+
+        agent = await agents.get()
+        reset_agent(agent)
+        try:
+            # Scoring blocks on the model, so it runs on a worker thread
+            result = await asyncio.get_running_loop().run_in_executor(
+                executor, score, query_data, i, total, self._ask(agent)
+            )
+        finally:
+            agents.put_nowait(agent)
+
+        stream.write(result)
+        return result
+
+
+def score_flat(query_data: Dict[str, Any], i: int, total: int, ask: Ask) -> Dict[str, Any]:
+    """
+    Score one query as a flat record of rounded time and scores
+
+    Errors are recorded as failed results rather than raised.
+    """
+    query = query_data['query']
+    lines = [f"\n[{i}/{total}] {query}..."]
+
+    start_time = time.perf_counter_ns()
+    try:
+        response_dict, response_time = ask(query)
+        response = response_dict.get('answer', str(response_dict))
+
+        # Calculate metrics
+        completeness = EvaluationMetrics.check_completeness(response, query_data.get('expected_info', []))['score']
+        relevance = EvaluationMetrics.check_relevance(query, response)
+
+        result = {
+            'query_id': query_data.get('id', i),
+            'query': query,
+            'category': query_data.get('category', 'unknown'),
+            'response': response,
+            'response_time': round(response_time, 2),
+            'completeness': round(completeness, 2),
+            'relevance': round(relevance, 2),
+            'success': True,
+            'timeout': False
+        }
+
+        lines.append(f"✓ {response_time:.2f}s | C:{completeness:.2f} | R:{relevance:.2f}")
+
+    except Exception as e:
+        response_time = (time.perf_counter_ns() - start_time) / 1e9
+        result = {
+            'query_id': query_data.get('id', i),
+            'query': query,
+            'category': query_data.get('category', 'unknown'),
+            'response': f"Error: {str(e)}",
+            'response_time': round(response_time, 2),
+            'completeness': 0.0,
+            'relevance': 0.0,
+            'success': False,
+            'timeout': response_time > 120,
+            'error': str(e)
+        }
+        lines.append(f"{str(e)[:60]}")
+
+    print_block(lines)
+    return result
+
+
+def flat_statistics(
+    records: List[Dict[str, Any]],
+    total_queries: int,
+    counts: List[Tuple[str, str, str]] = ()
+) -> Dict[str, Any]:
+    """
+    Summarize flat records, averaging time and scores over the successful queries
+
+    Args:
+        records: Flat result records
+        total_queries: Number of queries in the run
+        counts: Extra boolean record fields to count, as (field, count key,
+            rate key); each adds how many records set the field and that
+            number as a share of total_queries
+    """
+    # One array of (time, completeness, relevance, success, timeout, *counts) rows
+    rows = np.array([
+        (r['response_time'], r['completeness'], r['relevance'], r['success'], r.get('timeout', False),
+         *(r.get(field, False) for field, _, _ in counts))
+        for r in records
+    ], dtype=np.float64).reshape(-1, 5 + len(counts))
+    success = rows[:, 3].astype(bool)
+    successful = int(success.sum())
+    counted = [int(n) for n in rows[:, 5:].sum(axis=0)]
+
+    if not successful:
+        stats = {
+            'total_queries': total_queries,
+            'successful_queries': 0,
+            'success_rate': 0.0,
+            'avg_response_time': 0.0,
+            'avg_completeness': 0.0,
+            'avg_relevance': 0.0,
+            'timeout_rate': 1.0
+        }
+    else:
+        avg_time, avg_completeness, avg_relevance = rows[success, :3].mean(axis=0)
+        stats = {
+            'total_queries': total_queries,
+            'successful_queries': successful,
+            'success_rate': round(successful / total_queries, 2),
+            'avg_response_time': round(float(avg_time), 2),
+            'avg_completeness': round(float(avg_completeness), 2),
+            'avg_relevance': round(float(avg_relevance), 2),
+            'timeout_rate': round(float(rows[:, 4].sum()) / total_queries, 2)
+        }
+
+    for (_, count_key, _), n in zip(counts, counted):
+        stats[count_key] = n
+    for (_, _, rate_key), n in zip(counts, counted):
+        stats[rate_key] = round(n / total_queries, 2)
+    return stats
@@ -0,0 +1,26 @@
+"""
+Failure detection for the evaluation scripts
+Spots the markers an agent leaves in its answer when a query went wrong
+"""
+
+import re
+from typing import Set
+
+
+# Failure indicators in an agent's answer, found in one scan. The agent's own
+# markers match exactly; "max iterations" and "error" match in any case
+_FAILURE_RE = re.compile(
+    r"(?P<parsing_error>OUTPUT_PARSING_FAILURE)|(?P<agent_stopped>Agent stopped)"
+    r"|(?ai:(?P<max_iterations>max iterations)|(?P<error>error))"
+)
+
+
+def failure_indicators(response: str) -> Set[str]:
+    """
+    Find the failure indicators in a response
+
+    Returns:
+        Names of the indicators present: 'parsing_error', 'agent_stopped',
+        'max_iterations' and 'error'
+    """
+    return {match.lastgroup for match in _FAILURE_RE.finditer(response)}
@@ -0,0 +1,137 @@
+"""
+Result file reading and writing for the evaluation scripts
+Serializes results with orjson when it is installed, and streams per-query
+results to JSONL so interrupted runs can resume
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import orjson  # Faster encoder for large result files
+except ImportError:
+    orjson = None
+
+
+def _prefetch(fd: int) -> None:
+    """Ask the kernel to read a whole file ahead, where posix_fadvise exists (not on Windows/macOS)"""
+    if hasattr(os, 'posix_fadvise'):
+        # Advice values are not flags, so each is given separately
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+
+
+def load_json(path) -> Any:
+    """
+    Read a JSON file, parsing it with orjson when available
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        _prefetch(f.fileno())
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
+def save_json(data: Any, path, indent: bool = True) -> None:
+    """
+    Write data to a file as JSON
+
+    Args:
+        data: JSON-serializable results
+        path: Output file path
+        indent: Indent for reading; False writes compact JSON for files
+            only other scripts read
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w') as f:
+            if indent:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(',', ':'))
+
+
+def _dumps_line(record: Any) -> bytes:
+    """Encode one record as a single JSON line"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return json.dumps(record).encode('utf-8') + b'\n'
+
+
+# Streamed results are flushed to disk after this many queries
+STREAM_FLUSH_EVERY = 10
+
+
+class ResultStream:
+    """
+    Append per-query results to a JSONL file as they finish
+
+    Results already in the file (from a run that crashed or was interrupted)
+    are loaded on open, so the evaluation can skip those queries and resume.
+    The file is removed when the run finishes cleanly, since the caller then
+    writes the full results file.
+    """
+
+    def __init__(self, path, flush_every: int = STREAM_FLUSH_EVERY, key: str = 'query_id'):
+        """
+        Args:
+            path: JSONL file to append results to
+            flush_every: Number of results written between flushes
+            key: Field identifying the query a result belongs to
+        """
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.completed = {}
+        self._file = None
+        self._pending = 0
+        # Thread-pooled evaluators write from several workers
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        result = json.loads(line)
+                    except ValueError:
+                        # Last line cut short by the crash
+                        continue
+                    self.completed[result[key]] = result
+
+    def __enter__(self) -> 'ResultStream':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        # Start on a fresh line if the previous run stopped mid-write
+        if self._file.tell() and not self.path.read_bytes().endswith(b'\n'):
+            self._file.write(b'\n')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None:
+            self.path.unlink()
+        return False
+
+    def get(self, query_id) -> Optional[Dict[str, Any]]:
+        """Get the result recorded for a query by an earlier, interrupted run"""
+        return self.completed.get(query_id)
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """Append one query's result"""
+        line = _dumps_line(result)
+        with self._lock:
+            self._file.write(line)
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._file.flush()
+                self._pending = 0
@@ -0,0 +1,87 @@
+"""
+Test query loading for the evaluation scripts
+Reads query files incrementally with ijson when it is installed, and parses
+each file once per process
+"""
+
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Tuple
+
+from evaluation.scripts._output import load_json
+
+try:
+    import ijson  # Incremental parser for large query files
+except ImportError:
+    ijson = None
+
+# Keys a query file can keep its query list under, in order of preference
+QUERY_KEYS = ('test_queries', 'queries')
+
+
+def _starts_with_list(f) -> bool:
+    """Check whether a JSON file holds a top-level list, then rewind it"""
+    first = f.read(1)
+    while first and first.isspace():
+        first = f.read(1)
+    f.seek(0)
+    return first == b'['
+
+
+def iter_test_queries(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield test queries one at a time
+
+    Query files are either a list of queries or a dict with a 'test_queries'
+    or 'queries' list. With ijson installed a top-level list is decoded item
+    by item; otherwise the whole file is parsed at once (with orjson when
+    available).
+
+    Args:
+        file_path: Path to the test queries JSON file
+    """
+    if ijson is None:
+        data = load_json(file_path)
+        yield from (data if isinstance(data, list) else _query_list(data))
+        return
+
+    with open(file_path, 'rb') as f:
+        if _starts_with_list(f):
+            yield from ijson.items(f, 'item', use_float=True)
+        else:
+            yield from _query_list(dict(ijson.kvitems(f, '', use_float=True)))
+
+
+def _query_list(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Get the query list from a query file holding a dict"""
+    for key in QUERY_KEYS:
+        if key in data:
+            return data[key]
+    raise KeyError(QUERY_KEYS[-1])
+
+
+@lru_cache(maxsize=None)
+def _read_test_queries(file_path: str, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:
+    """Parse a query file once per modification time"""
+    return tuple(iter_test_queries(file_path))
+
+
+def load_test_queries(file_path: str, max_queries: int = None) -> List[Dict[str, Any]]:
+    """
+    Load test queries, parsing the file only on the first call
+
+    Later calls for the same file reuse the parsed queries until the file
+    changes. Each call gets its own copy of the query dicts, so callers
+    may modify them.
+
+    Args:
+        file_path: Path to the test queries JSON file
+        max_queries: Limit number of queries (optional)
+
+    Returns:
+        List of test queries
+    """
+    path = os.path.abspath(file_path)
+    queries = _read_test_queries(path, os.stat(path).st_mtime_ns)
+    return [dict(query) for query in islice(queries, max_queries)]
@@ -4,48 +4,86 @@ Runs comprehensive evaluation on both Llama and Mistral models
 """
 
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from queue import Queue
+from typing import List, Dict, Any, Iterator
+
+try:
+    import orjson  # Faster encoder for large result files
+except ImportError:
+    orjson = None
+try:
+    import ijson  # Incremental parser for large query files
+except ImportError:
+    ijson = None
 
 from src.agent.agent_orchestrator import SJSUAgent
 from src.utils.logger import logger
 from evaluation.metrics import EvaluationMetrics
+from evaluation.scripts._agents import reset_agent
+from evaluation.scripts._cache import cached_query
+from evaluation.scripts._evaluator_base import GROQ_JOBS, LOCAL_JOBS
+
+
+# Test queries sent to a model at once; each worker gets its own agent. The
+# Llama API takes many at once, while local Mistral only has room for a couple
+EVALUATION_WORKERS = {"llama": GROQ_JOBS, "mistral": LOCAL_JOBS}
 
 
 class Evaluator:
     """Evaluation framework for comparing LLM models"""
 
-    def __init__(self, test_queries_path: str = "../data/queries/test_queries.json"):
+    def __init__(self, test_queries_path: str = "../data/queries/test_queries.json", use_cache: bool = False):
         """
         Initialize evaluator
 
         Args:
             test_queries_path: Path to test queries JSON file
+            use_cache: Reuse answers cached by earlier runs
         """
         self.test_queries_path = test_queries_path
+        self.use_cache = use_cache
         self.test_queries = self._load_test_queries()
         self.results_dir = Path("evaluation/results")
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
+        # Agent pools being created in the background, by (model_type, model_name)
+        self._agent_pools = {}
+
+        # Aggregates by id() of the results list they were computed from
+        self._aggregates = {}
+
         logger.info(f"✓ Loaded {len(self.test_queries)} test queries")
 
     def _load_test_queries(self) -> List[Dict[str, Any]]:
         """Load test queries from JSON file"""
         try:
-            with open(self.test_queries_path, 'r') as f:
-                data = json.load(f)
-            return data['test_queries']
+            return list(self._iter_test_queries())
         except Exception as e:
             logger.error(f"Failed to load test queries: {e}")
             return []
 
+    def _iter_test_queries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the test queries one at a time
+
+        With ijson installed only the test_queries array is decoded, item by
+        item; otherwise the whole file is parsed with json.
+        """
+        with open(self.test_queries_path, 'rb') as f:
+            if ijson is not None:
+                yield from ijson.items(f, 'test_queries.item', use_float=True)
+            else:
+                yield from json.load(f)['test_queries']
+
     def evaluate_model(
         self,
         model_type: str,
         model_name: str = None,
-        max_queries: int = None
+        max_queries: int = None,
+        max_workers: int = None
     ) -> List[Dict[str, Any]]:
         """
         Evaluate a single model on all test queries
@@ -54,76 +92,53 @@ class Evaluator:
             model_type: "llama" or "mistral"
             model_name: Specific model name (optional)
             max_queries: Limit number of queries for testing (optional)
+            max_workers: Number of queries sent to the model at once
+                (default: the model's EVALUATION_WORKERS entry)
 
         Returns:
-            List of evaluation results
+            List of evaluation results without response text; the full
+            evaluations are streamed to a JSONL file in the results directory
         """
         logger.info(f"EVALUATING {model_type.upper()} MODEL")
 
-        # Initialize agent
-        logger.info(f"Initializing {model_type} agent...")
-        agent = SJSUAgent(model_type=model_type, model_name=model_name, verbose=False)
-        logger.info("Agent ready\n")
-
         results = []
         queries_to_run = self.test_queries[:max_queries] if max_queries else self.test_queries
+        max_workers = max_workers or EVALUATION_WORKERS.get(model_type, LOCAL_JOBS)
+        workers = max(1, min(max_workers, len(queries_to_run)))
+
+        # Queries are network-bound, so several run at once; agents keep
+        # conversation state, so each worker borrows one of its own
+        prewarmed = self._agent_pools.pop((model_type, model_name), None)
+        if prewarmed is not None:
+            logger.info(f"Waiting for prewarmed {model_type} agents...")
+            agents = prewarmed.result()
+        else:
+            logger.info(f"Initializing {workers} {model_type} agent(s)...")
+            agents = self._build_agents(model_type, model_name, workers)
+        logger.info("Agents ready\n")
 
-        for i, query_data in enumerate(queries_to_run, 1):
-            logger.info(f"Query {i}/{len(queries_to_run)} (ID: {query_data['id']})")
-            logger.info(f"Category: {query_data['category']}")
-            logger.info(f"Complexity: {query_data['complexity']}")
-            logger.info(f"Query: {query_data['query']}")
-            logger.info("")
-
-            try:
-                # Time the query
-                start_time = time.time()
-                response_data = agent.query(query_data['query'])
-                end_time = time.time()
-
-                response = response_data['answer']
-                response_time = end_time - start_time
-
-                logger.info(f"Response time: {response_time:.2f}s")
-                logger.info(f"Response preview: {response[:150]}...")
-
-                # Evaluate the response
-                evaluation = EvaluationMetrics.evaluate_single_query(
-                    query_data=query_data,
-                    response=response,
-                    response_time=response_time,
-                    model=model_type
+        # Each evaluation is written out as soon as it is scored, so a crash
+        # keeps everything done so far and responses never pile up in memory
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stream_path = self.results_dir / f"{model_type}_evaluations_{timestamp}.jsonl"
+        with open(stream_path, 'w') as stream, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._run_one, agents, query_data,
+                    model_type, model_name, i, len(queries_to_run)
                 )
+                for i, query_data in enumerate(queries_to_run, 1)
+            ]
+            # Recorded in query order so results line up across models
+            for future in futures:
+                self._record(stream, results, future.result())
 
-                results.append(evaluation)
-
-                logger.info(f"Completeness: {evaluation['metrics']['completeness_score']:.2f}")
-                logger.info(f"Relevance: {evaluation['metrics']['relevance_score']:.2f}")
-
-            except Exception as e:
-                logger.error(f"Query failed: {e}")
-                # Record failed query
-                results.append({
-                    "query_id": query_data['id'],
-                    "query": query_data['query'],
-                    "category": query_data['category'],
-                    "complexity": query_data['complexity'],
-                    "model": model_type,
-                    "response": f"ERROR: {str(e)}",
-                    "metrics": {
-                        "response_time": 0,
-                        "completeness_score": 0,
-                        "relevance_score": 0,
-                        "length": {"words": 0, "characters": 0, "sentences": 0},
-                        "injection_defense": False
-                    },
-                    "error": str(e)
-                })
+        logger.info(f"✓ Evaluations streamed to {stream_path}")
 
         # Aggregate results
         logger.info(f"RESULTS SUMMARY FOR {model_type.upper()}")
 
-        aggregated = EvaluationMetrics.aggregate_results(results)
+        aggregated = self._aggregate(results)
 
         logger.info(f"Total queries: {aggregated['total_queries']}")
         logger.info(f"Avg response time: {aggregated['averages']['response_time']:.2f}s")
@@ -134,6 +149,192 @@ class Evaluator:
 
         return results
 
+    def _run_one(
+        self,
+        agents: Queue,
+        query_data: Dict[str, Any],
+        model_type: str,
+        model_name: str,
+        position: int,
+        total: int
+    ) -> Dict[str, Any]:
+        """
+        Run and score one test query, answering from the response cache when possible
+
+        Args:
+            agents: Pool of idle agents
+            query_data: Test query to run
+            model_type: "llama" or "mistral"
+            model_name: Specific model name, or None for the default
+            position: 1-based index of the query, for logging
+            total: Number of queries in the run, for logging
+
+        Returns:
+            Evaluation result, or a zero-scored record if the query failed
+        """
+        # Queries run on several threads, so each one's lines are logged as a
+        # single record rather than interleaving with other queries' lines
+        lines = [
+            f"Query {position}/{total} (ID: {query_data['id']})",
+            f"Category: {query_data['category']}",
+            f"Complexity: {query_data['complexity']}",
+            f"Query: {query_data['query']}",
+            ""
+        ]
+
+        # Answers are cached under the same label as the other evaluation
+        # scripts use for the model's default agent
+        label = model_type if model_name is None else f"{model_type}:{model_name}"
+        try:
+            response_data, response_time = cached_query(
+                label, query_data['query'], lambda query: self._query_agent(agents, query), self.use_cache
+            )
+            response = response_data['answer']
+            if response_data.get('cached'):
+                lines.append("Response from cache")
+
+            lines.append(f"Response time: {response_time:.2f}s")
+            lines.append(f"Response preview: {response[:150]}...")
+
+            # Evaluate the response
+            evaluation = EvaluationMetrics.evaluate_single_query(
+                query_data=query_data,
+                response=response,
+                response_time=response_time,
+                model=model_type
+            )
+
+            lines.append(f"Completeness: {evaluation['metrics']['completeness_score']:.2f}")
+            lines.append(f"Relevance: {evaluation['metrics']['relevance_score']:.2f}")
+            logger.info('\n'.join(lines))
+
+            return evaluation
+
+        except Exception as e:
+            lines.append(f"Query failed: {e}")
+            logger.error('\n'.join(lines))
+            # Record failed query
+            return {
+                "query_id": query_data['id'],
+                "query": query_data['query'],
+                "category": query_data['category'],
+                "complexity": query_data['complexity'],
+                "model": model_type,
+                "response": f"ERROR: {str(e)}",
+                "metrics": {
+                    "response_time": 0,
+                    "completeness_score": 0,
+                    "relevance_score": 0,
+                    "length": {"words": 0, "characters": 0, "sentences": 0},
+                    "injection_defense": False
+                },
+                "error": str(e)
+            }
+
+    @staticmethod
+    def _query_agent(agents: Queue, query: str) -> Dict[str, Any]:
+        """
+        Ask a query with an agent borrowed from the pool
+
+        Args:
+            agents: Pool of idle agents
+            query: Query text
+
+        Returns:
+            The agent's response dict
+        """
+        agent = agents.get()
+        reset_agent(agent)
+        try:
+            return agent.query(query)
+        finally:
+            agents.put(agent)
+
+    @staticmethod
+    def _build_agents(model_type: str, model_name: str, count: int) -> Queue:
+        """
+        Create a pool of agents for one model
+
+        Args:
+            model_type: "llama" or "mistral"
+            model_name: Specific model name, or None for the default
+            count: Number of agents to create
+
+        Returns:
+            Queue holding the idle agents
+        """
+        agents = Queue()
+        for _ in range(count):
+            agents.put(SJSUAgent(model_type=model_type, model_name=model_name, verbose=False))
+        return agents
+
+    def prewarm_agents(
+        self,
+        model_type: str,
+        model_name: str = None,
+        max_queries: int = None,
+        max_workers: int = None
+    ):
+        """
+        Start creating a model's agents in the background
+
+        The next evaluate_model call for the same model picks up the pool
+        instead of creating agents itself.
+
+        Args:
+            model_type: "llama" or "mistral"
+            model_name: Specific model name (optional)
+            max_queries: Query limit the evaluation will use (optional)
+            max_workers: Worker count the evaluation will use (default as in evaluate_model)
+        """
+        queries = len(self.test_queries[:max_queries] if max_queries else self.test_queries)
+        max_workers = max_workers or EVALUATION_WORKERS.get(model_type, LOCAL_JOBS)
+        workers = max(1, min(max_workers, queries))
+
+        logger.info(f"Prewarming {workers} {model_type} agent(s) in the background...")
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._agent_pools[(model_type, model_name)] = executor.submit(
+            self._build_agents, model_type, model_name, workers
+        )
+        # The pending build still runs; the thread exits once it is done
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def _record(stream, results: List[Dict[str, Any]], evaluation: Dict[str, Any]):
+        """
+        Append an evaluation to the JSONL stream and keep it without its response
+
+        Args:
+            stream: Open JSONL file for this model's evaluations
+            results: In-memory results used for aggregation and comparison
+            evaluation: Full evaluation for one query
+        """
+        stream.write(json.dumps(evaluation) + '\n')
+        stream.flush()
+        results.append({key: value for key, value in evaluation.items() if key != 'response'})
+
+    def _aggregate(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Aggregate a results list, reusing the statistics from an earlier call
+
+        evaluate_model already aggregates its results for the summary, so
+        compare_models gets them back instead of recomputing.
+
+        Args:
+            results: List of evaluation results
+
+        Returns:
+            Aggregated statistics
+        """
+        # The list itself is kept in the entry so its id cannot be reused
+        cached = self._aggregates.get(id(results))
+        if cached is not None and cached[0] is results and cached[1] == len(results):
+            return cached[2]
+
+        aggregated = EvaluationMetrics.aggregate_results(results)
+        self._aggregates[id(results)] = (results, len(results), aggregated)
+        return aggregated
+
     def compare_models(
         self,
         mistral_results: List[Dict[str, Any]],
@@ -149,8 +350,8 @@ class Evaluator:
         Returns:
             Comparison report
         """
-        mistral_agg = EvaluationMetrics.aggregate_results(mistral_results)
-        llama_agg = EvaluationMetrics.aggregate_results(llama_results)
+        mistral_agg = self._aggregate(mistral_results)
+        llama_agg = self._aggregate(llama_results)
 
         comparison = {
             "mistral": mistral_agg,
@@ -200,8 +401,7 @@ class Evaluator:
         filename = f"{model_type}_results_{timestamp}.json"
         filepath = self.results_dir / filename
 
-        with open(filepath, 'w') as f:
-            json.dump(results, f, indent=2)
+        self._write_json(filepath, results)
 
         logger.info(f"✓ Results saved to {filepath}")
 
@@ -211,11 +411,20 @@ class Evaluator:
         filename = f"comparison_{timestamp}.json"
         filepath = self.results_dir / filename
 
-        with open(filepath, 'w') as f:
-            json.dump(comparison, f, indent=2)
+        self._write_json(filepath, comparison)
 
         logger.info(f"✓ Comparison saved to {filepath}")
 
+    @staticmethod
+    def _write_json(filepath: Path, data: Any):
+        """Write data as indented JSON, using orjson when it is installed"""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2)
+
     def run_full_evaluation(self, max_queries: int = None):
         """
         Run complete evaluation on both models
@@ -227,6 +436,9 @@ class Evaluator:
         logger.info(f"\nEvaluating both models on {max_queries or len(self.test_queries)} queries")
         logger.info("This may take several minutes...\n")
 
+        # Load Llama's agents while Mistral is being evaluated
+        self.prewarm_agents("llama", max_queries=max_queries)
+
         # Evaluate Mistral
         mistral_results = self.evaluate_model("mistral", max_queries=max_queries)
         self.save_results(mistral_results, "mistral")
@@ -3,32 +3,55 @@ Custom Evaluation Script for SJSU Virtual Assistant
 Using user-specified queries
 """
 
-import json
+import argparse
+import asyncio
+import logging
 import sys
-import os
-import time
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.agent.agent_orchestrator import SJSUAgent
 from evaluation.metrics import EvaluationMetrics
+from evaluation.scripts._evaluator_base import Ask, Evaluator
+from evaluation.scripts._output import save_json
+from evaluation.scripts._queries import load_test_queries
 from src.utils.logger import logger
 
 
+# Queries in flight per model: the Llama API takes many at once, while the
+# local Mistral model only has capacity for a couple
+DEFAULT_JOBS = {"llama": 8, "mistral": 2}
+
+# Comparison summary logged at the end of run_full_evaluation as one record
+SUMMARY_TEMPLATE = (
+    "PERFORMANCE COMPARISON:\n"
+    "Speed winner: {speed}\n"
+    "Mistral: {m_time:.2f}s\n"
+    "Llama: {l_time:.2f}s\n"
+    "\n"
+    "Completeness winner: {completeness}\n"
+    "Mistral: {m_comp:.2f}\n"
+    "Llama: {l_comp:.2f}\n"
+    "\n"
+    "Relevance winner: {relevance}\n"
+    "Mistral: {m_rel:.2f}\n"
+    "Llama: {l_rel:.2f}\n"
+)
+
+
 class CustomEvaluator:
     """Evaluate models with custom queries"""
 
-    def __init__(self, queries_file: str = "../data/queries/test_queries_custom.json"):
-        """Initialize evaluator with custom queries"""
+    def __init__(self, queries_file: str = "../data/queries/test_queries_custom.json", use_cache: bool = False):
+        """Initialize evaluator with custom queries; use_cache reuses answers from earlier runs"""
         self.queries_file = queries_file
+        self.use_cache = use_cache
         self.metrics = EvaluationMetrics()
 
         # Load queries
-        with open(queries_file, 'r') as f:
-            self.test_queries = json.load(f)
+        self.test_queries = load_test_queries(queries_file)
 
         logger.info(f"Loaded {len(self.test_queries)} custom queries")
 
@@ -36,63 +59,90 @@ class CustomEvaluator:
         self.results_dir = Path("evaluation/results")
         self.results_dir.mkdir(exist_ok=True)
 
-    def evaluate_model(self, model_type: str, max_queries: int = None) -> list:
-        """Evaluate a single model on all queries"""
-        logger.info(f"EVALUATING {model_type.upper()} MODEL")
-
-        # Initialize agent
-        logger.info(f"Initializing {model_type} agent...")
-        agent = SJSUAgent(model_type=model_type, verbose=False)
+    async def evaluate_model(self, model_type: str, max_queries: int = None, jobs: int = None) -> list:
+        """Evaluate a single model on all queries, running up to `jobs` queries at once"""
+        logger.info("EVALUATING %s MODEL", model_type.upper())
+
+        jobs = jobs or DEFAULT_JOBS.get(model_type, 1)
+        logger.info("Initializing %d %s agent(s)...", jobs, model_type)
+        # Results are streamed to JSONL as they finish; a file left by an
+        # interrupted run lets this one skip the queries already done
+        evaluator = Evaluator(
+            model_type, label=model_type, jobs=jobs, use_cache=self.use_cache,
+            stream_file=self.results_dir / f"{model_type}_results_custom.jsonl"
+        )
         logger.info("Agent ready\n")
 
-        results = []
         queries = self.test_queries[:max_queries] if max_queries else self.test_queries
 
-        for i, query_data in enumerate(queries, 1):
-            logger.info(f"Query {i}/{len(queries)} (ID: {query_data['id']})")
-            logger.info(f"Category: {query_data['category']}")
-            logger.info(f"Complexity: {query_data['complexity']}")
-            logger.info(f"Query: {query_data['query']}")
-            logger.info("")
-
-            # Run query
-            start_time = time.time()
-            response = agent.query(query_data['query'])
-            end_time = time.time()
-            response_time = end_time - start_time
-
-            # Evaluate
-            evaluation = self.metrics.evaluate_single_query(
-                query_data=query_data,
-                response=response['answer'],
-                response_time=response_time,
-                model=model_type
-            )
-
-            # Log results
-            logger.info(f"⏱Response time: {evaluation['metrics']['response_time']:.2f}s")
-            logger.info(f"Response preview: {response['answer'][:150]}...")
-            logger.info(f"Completeness: {evaluation['metrics']['completeness_score']:.2f}")
-            logger.info(f"Relevance: {evaluation['metrics']['relevance_score']:.2f}")
-
-            # Store result
-            results.append(evaluation)
+        def score(query_data, i, total, ask):
+            return self._score_one(model_type, query_data, i, total, ask)
+
+        results = await evaluator.evaluate(queries, score)
 
         # Calculate summary statistics
-        logger.info(f"RESULTS SUMMARY FOR {model_type.upper()}")
+        logger.info("RESULTS SUMMARY FOR %s", model_type.upper())
 
         summary = self.metrics.aggregate_results(results)
-        logger.info(f"Total queries: {len(results)}")
-        logger.info(f"Avg response time: {summary['averages']['response_time']:.2f}s")
-        logger.info(f"Avg completeness: {summary['averages']['completeness_score']:.2f}")
-        logger.info(f"Avg relevance: {summary['averages']['relevance_score']:.2f}")
-        logger.info(f"Avg response length: {summary['averages']['response_length_words']:.0f} words")
+        logger.info("Total queries: %d", len(results))
+        logger.info("Avg response time: %.2fs", summary['averages']['response_time'])
+        logger.info("Avg completeness: %.2f", summary['averages']['completeness_score'])
+        logger.info("Avg relevance: %.2f", summary['averages']['relevance_score'])
+        logger.info("Avg response length: %.0f words", summary['averages']['response_length_words'])
 
         if 'injection_defense_rate' in summary.get('security', {}):
-            logger.info(f"Injection defense rate: {summary['security']['injection_defense_rate']:.2f}")
+            logger.info("Injection defense rate: %.2f", summary['security']['injection_defense_rate'])
+
+        return results
+
+    def _score_one(self, model_type: str, query_data: dict, i: int, total: int, ask: Ask) -> dict:
+        """Run and score one query; called on an evaluator worker thread"""
+        logger.info("Query %d/%d (ID: %s)", i, total, query_data['id'])
+        logger.info("Category: %s", query_data['category'])
+        logger.info("Complexity: %s", query_data['complexity'])
+        logger.info("Query: %s", query_data['query'])
+        logger.info("")
 
+        # Run query (or reuse the answer from an earlier run)
+        response, response_time = ask(query_data['query'])
+
+        # Evaluate
+        evaluation = self.metrics.evaluate_single_query(
+            query_data=query_data,
+            response=response['answer'],
+            response_time=response_time,
+            model=model_type
+        )
+
+        # Log results; %-style arguments are only formatted if INFO is enabled
+        logger.info("⏱Response time: %.2fs", evaluation['metrics']['response_time'])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Response preview: %s...", response['answer'][:150])
+        logger.info("Completeness: %.2f", evaluation['metrics']['completeness_score'])
+        logger.info("Relevance: %.2f", evaluation['metrics']['relevance_score'])
+
+        return evaluation
+
+    async def _evaluate_and_save(self, model_type: str, jobs: int = None, timestamp: str = None) -> list:
+        """Evaluate one model and save its results as soon as it finishes"""
+        results = await self.evaluate_model(model_type, jobs=jobs)
+        self.save_results(results, model_type, timestamp)
         return results
 
+    async def _evaluate_both(self, jobs: int = None, timestamp: str = None) -> tuple:
+        """Evaluate Mistral and Llama at the same time"""
+        # The models run on separate backends (local Ollama and the Groq API).
+        # Each is saved as it finishes, so a failure in one keeps the other's results
+        outcomes = await asyncio.gather(
+            self._evaluate_and_save("mistral", jobs, timestamp),
+            self._evaluate_and_save("llama", jobs, timestamp),
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return outcomes
+
     def compare_models(self, mistral_results: list, llama_results: list) -> dict:
         """Compare results between two models"""
         # Aggregate by category
@@ -133,71 +183,91 @@ class CustomEvaluator:
 
         return comparison
 
-    def save_results(self, results: list, model_type: str):
-        """Save results to JSON file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def save_results(self, results: list, model_type: str, timestamp: str = None):
+        """Save results to JSON file, named with the given run timestamp (default: now)"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = self.results_dir / f"{model_type}_results_custom_{timestamp}.json"
 
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        save_json(results, filename)
 
-        logger.info(f"Results saved to {filename}")
+        logger.info("Results saved to %s", filename)
         return filename
 
-    def save_comparison(self, comparison: dict):
-        """Save comparison to JSON file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def save_comparison(self, comparison: dict, timestamp: str = None):
+        """Save comparison to JSON file, named with the given run timestamp (default: now)"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = self.results_dir / f"comparison_custom_{timestamp}.json"
 
-        with open(filename, 'w') as f:
-            json.dump(comparison, f, indent=2)
+        save_json(comparison, filename)
 
-        logger.info(f"Comparison saved to {filename}")
+        logger.info("Comparison saved to %s", filename)
         return filename
 
-    def run_full_evaluation(self):
-        """Run complete evaluation on both models"""
+    def run_full_evaluation(self, jobs: int = None, parallel_models: bool = False):
+        """
+        Run complete evaluation on both models
+
+        Args:
+            jobs: Queries run at once per model (defaults to DEFAULT_JOBS)
+            parallel_models: Evaluate Mistral and Llama at the same time
+                instead of one after the other
+        """
         logger.info("STARTING CUSTOM EVALUATION")
-        logger.info(f"Total queries: {len(self.test_queries)}")
-        logger.info(f"Estimated time: {len(self.test_queries) * 2 * 45 / 60:.0f}-{len(self.test_queries) * 2 * 90 / 60:.0f} minutes")
+        logger.info("Total queries: %d", len(self.test_queries))
+        logger.info("Estimated time: %.0f-%.0f minutes",
+                    len(self.test_queries) * 2 * 45 / 60, len(self.test_queries) * 2 * 90 / 60)
         logger.info("")
 
-        # Evaluate Mistral
-        mistral_results = self.evaluate_model("mistral")
-        self.save_results(mistral_results, "mistral")
+        # One timestamp names every file this run writes
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Evaluate Llama
-        llama_results = self.evaluate_model("llama")
-        self.save_results(llama_results, "llama")
+        if parallel_models:
+            mistral_results, llama_results = asyncio.run(self._evaluate_both(jobs, timestamp))
+        else:
+            # Evaluate Mistral
+            mistral_results = asyncio.run(self._evaluate_and_save("mistral", jobs, timestamp))
+
+            # Evaluate Llama
+            llama_results = asyncio.run(self._evaluate_and_save("llama", jobs, timestamp))
 
         # Compare results
         logger.info("FINAL COMPARISON")
 
         comparison = self.compare_models(mistral_results, llama_results)
-        self.save_comparison(comparison)
+        self.save_comparison(comparison, timestamp)
 
         # Print comparison summary
-        logger.info("PERFORMANCE COMPARISON:")
-        logger.info(f"Speed winner: {comparison['winner']['speed'].upper()}")
-        logger.info(f"Mistral: {comparison['mistral']['averages']['response_time']:.2f}s")
-        logger.info(f"Llama: {comparison['llama']['averages']['response_time']:.2f}s")
-        logger.info("")
-        logger.info(f"Completeness winner: {comparison['winner']['completeness'].upper()}")
-        logger.info(f"Mistral: {comparison['mistral']['averages']['completeness_score']:.2f}")
-        logger.info(f"Llama: {comparison['llama']['averages']['completeness_score']:.2f}")
-        logger.info("")
-        logger.info(f"Relevance winner: {comparison['winner']['relevance'].upper()}")
-        logger.info(f"Mistral: {comparison['mistral']['averages']['relevance_score']:.2f}")
-        logger.info(f"Llama: {comparison['llama']['averages']['relevance_score']:.2f}")
-        logger.info("")
+        if logger.isEnabledFor(logging.INFO):
+            mistral_avg = comparison['mistral']['averages']
+            llama_avg = comparison['llama']['averages']
+            logger.info(SUMMARY_TEMPLATE.format(
+                speed=comparison['winner']['speed'].upper(),
+                m_time=mistral_avg['response_time'],
+                l_time=llama_avg['response_time'],
+                completeness=comparison['winner']['completeness'].upper(),
+                m_comp=mistral_avg['completeness_score'],
+                l_comp=llama_avg['completeness_score'],
+                relevance=comparison['winner']['relevance'].upper(),
+                m_rel=mistral_avg['relevance_score'],
+                l_rel=llama_avg['relevance_score']
+            ))
 
         logger.info("EVALUATION COMPLETE")
-        logger.info(f"\nResults saved to: {self.results_dir}")
+        logger.info("\nResults saved to: %s", self.results_dir)
 
 
 def main():
-    evaluator = CustomEvaluator()
-    evaluator.run_full_evaluation()
+    parser = argparse.ArgumentParser(description="Evaluate both models on the custom queries")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Queries run at once per model (default: 8 for Llama, 2 for local Mistral)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse answers cached by earlier runs; their response times are from those runs")
+    parser.add_argument("--parallel-models", action="store_true",
+                        help="Evaluate Mistral and Llama at the same time (may slow local Mistral)")
+    args = parser.parse_args()
+
+    evaluator = CustomEvaluator(use_cache=args.cache)
+    evaluator.run_full_evaluation(jobs=args.jobs, parallel_models=args.parallel_models)
 
 
 if __name__ == "__main__":
@@ -3,8 +3,7 @@
 Evaluation - Database-only (no web search to avoid hangs)
 """
 
-import json
-import time
+import argparse
 import sys
 import os
 from datetime import datetime
@@ -12,27 +11,32 @@ from typing import Dict, Any
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.agent.agent_orchestrator import SJSUAgent
-from evaluation.metrics import EvaluationMetrics
+from evaluation.scripts._evaluator_base import GROQ_JOBS, LOCAL_JOBS, Evaluator, flat_statistics, score_flat
+from evaluation.scripts._output import save_json
+from evaluation.scripts._queries import load_test_queries as _load_test_queries
 
-def load_test_queries(file_path: str = "../data/queries/test_queries_custom.json"):
-    """Load test queries from JSON file"""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-        if isinstance(data, list):
-            return data
-        else:
-            return data['queries']
+def load_test_queries(file_path: str = "../data/queries/test_queries_custom.json", max_queries: int = None):
+    """Load test queries from JSON file (a list, or a dict with a 'queries' list)"""
+    return _load_test_queries(file_path, max_queries)
 
-def evaluate_model(model_type: str, use_groq: bool, queries: list) -> Dict[str, Any]:
-    """Evaluate a model"""
+def evaluate_model(model_type: str, use_groq: bool, queries: list, jobs: int = None,
+                   use_cache: bool = False, stream_file: str = None) -> Dict[str, Any]:
+    """
+    Evaluate a model, running up to `jobs` queries at once (reusing cached answers with use_cache)
+
+    Each result is also appended to stream_file as it finishes (default:
+    ../data/results/final_<model>.jsonl); if that file is left over from an
+    interrupted run, the queries it already holds are skipped.
+    """
 
     model_name = f"{'Groq-' if use_groq else ''}{'Llama-3.3-70B' if model_type == 'llama' else 'Mistral-7B'}"
 
     print(f"Evaluating: {model_name}")
 
-    # Initialize agent (disable web search)
-    agent = SJSUAgent(model_type=model_type, use_groq=use_groq)
+    evaluator = Evaluator(
+        model_type, use_groq, label=model_name, jobs=jobs, use_cache=use_cache,
+        stream_file=stream_file or f"../data/results/final_{model_type}{'_groq' if use_groq else ''}.jsonl"
+    )
 
     results = {
         'model': model_name,
@@ -40,87 +44,19 @@ def evaluate_model(model_type: str, use_groq: bool, queries: list) -> Dict[str,
         'timestamp': datetime.now().isoformat()
     }
 
-    metrics = EvaluationMetrics()
-
-    for i, query_data in enumerate(queries, 1):
-        query = query_data['query']
-        print(f"\n[{i}/{len(queries)}] {query}...")
-
-        start_time = time.time()
-        try:
-            response_dict = agent.query(query)
-            response_time = time.time() - start_time
-
-            response = response_dict.get('answer', str(response_dict))
-
-            # Calculate metrics
-            completeness_result = metrics.check_completeness(
-                response,
-                query_data.get('expected_info', [])
-            )
-            completeness = completeness_result['score']
-            relevance = metrics.check_relevance(query, response)
-
-            result = {
-                'query_id': query_data.get('id', i),
-                'query': query,
-                'category': query_data.get('category', 'unknown'),
-                'response': response,
-                'response_time': round(response_time, 2),
-                'completeness': round(completeness, 2),
-                'relevance': round(relevance, 2),
-                'success': True,
-                'timeout': False
-            }
-
-            print(f"✓ {response_time:.2f}s | C:{completeness:.2f} | R:{relevance:.2f}")
-
-        except Exception as e:
-            response_time = time.time() - start_time
-            result = {
-                'query_id': query_data.get('id', i),
-                'query': query,
-                'category': query_data.get('category', 'unknown'),
-                'response': f"Error: {str(e)}",
-                'response_time': round(response_time, 2),
-                'completeness': 0.0,
-                'relevance': 0.0,
-                'success': False,
-                'timeout': response_time > 120,
-                'error': str(e)
-            }
-            print(f"{str(e)[:60]}")
-
-        results['queries'].append(result)
-        time.sleep(1)  # Brief pause
-
-    # Calculate statistics
-    successful_queries = [r for r in results['queries'] if r['success']]
-
-    if successful_queries:
-        results['statistics'] = {
-            'total_queries': len(queries),
-            'successful_queries': len(successful_queries),
-            'success_rate': round(len(successful_queries) / len(queries), 2),
-            'avg_response_time': round(sum(r['response_time'] for r in successful_queries) / len(successful_queries), 2),
-            'avg_completeness': round(sum(r['completeness'] for r in successful_queries) / len(successful_queries), 2),
-            'avg_relevance': round(sum(r['relevance'] for r in successful_queries) / len(successful_queries), 2),
-            'timeout_rate': round(sum(1 for r in results['queries'] if r.get('timeout', False)) / len(queries), 2)
-        }
-    else:
-        results['statistics'] = {
-            'total_queries': len(queries),
-            'successful_queries': 0,
-            'success_rate': 0.0,
-            'avg_response_time': 0.0,
-            'avg_completeness': 0.0,
-            'avg_relevance': 0.0,
-            'timeout_rate': 1.0
-        }
+    results['queries'] = evaluator.run(queries, score_flat)
+    results['statistics'] = flat_statistics(results['queries'], len(queries))
 
     return results
 
 def main():
+    parser = argparse.ArgumentParser(description="Compare Groq Llama-3.3-70B with local Mistral-7B")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help=f"Queries run at once per model (default: {GROQ_JOBS} for Groq, {LOCAL_JOBS} for local Mistral)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse answers cached by earlier runs; their response times are from those runs")
+    args = parser.parse_args()
+
     print("MODEL COMPARISON EVALUATION")
     print("Groq Llama-3.3-70B vs Local Mistral-7B")
 
@@ -129,18 +65,18 @@ def main():
 
     # Evaluate Groq Llama
     print("Evaluating Groq Llama-3.3-70B")
-    llama_results = evaluate_model('llama', use_groq=True, queries=queries)
+    llama_results = evaluate_model('llama', use_groq=True, queries=queries, jobs=args.jobs,
+                                   use_cache=args.cache)
 
-    with open('../data/results/final_llama_groq.json', 'w') as f:
-        json.dump(llama_results, f, indent=2)
+    save_json(llama_results, '../data/results/final_llama_groq.json')
     print(f"\n Llama results saved")
 
     # Evaluate Mistral
     print("Evaluating Local Mistral-7B")
-    mistral_results = evaluate_model('mistral', use_groq=False, queries=queries)
+    mistral_results = evaluate_model('mistral', use_groq=False, queries=queries, jobs=args.jobs,
+                                     use_cache=args.cache)
 
-    with open('../data/results/final_mistral.json', 'w') as f:
-        json.dump(mistral_results, f, indent=2)
+    save_json(mistral_results, '../data/results/final_mistral.json')
     print(f"\n Mistral results saved")
 
     # Display comparison
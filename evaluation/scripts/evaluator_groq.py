@@ -3,7 +3,7 @@
 Evaluation with Groq API - Compare Llama-3.3-70B (Groq) vs Mistral-7B (Local)
 """
 
-import json
+import argparse
 import time
 import sys
 import os
@@ -13,20 +13,17 @@ from typing import Dict, Any
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.agent.agent_orchestrator import SJSUAgent
 from evaluation.metrics import EvaluationMetrics
+from evaluation.scripts._evaluator_base import GROQ_JOBS, Ask, Evaluator, print_block
+from evaluation.scripts._output import save_json
+from evaluation.scripts._queries import load_test_queries as _load_test_queries
 
-def load_test_queries(file_path: str = "../data/queries/test_queries_custom.json"):
-    """Load test queries from JSON file"""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-        # Handle both formats: list or dict with 'queries' key
-        if isinstance(data, list):
-            return data
-        else:
-            return data['queries']
-
-def evaluate_model(model_type: str, use_groq: bool = False, queries: list = None) -> Dict[str, Any]:
+def load_test_queries(file_path: str = "../data/queries/test_queries_custom.json", max_queries: int = None):
+    """Load test queries from JSON file (a list, or a dict with a 'queries' list)"""
+    return _load_test_queries(file_path, max_queries)
+
+def evaluate_model(model_type: str, use_groq: bool = False, queries: list = None,
+                   use_cache: bool = False, stream_file: str = None) -> Dict[str, Any]:
     """
     Evaluate a model on test queries
 
@@ -34,6 +31,10 @@ def evaluate_model(model_type: str, use_groq: bool = False, queries: list = None
         model_type: "llama" or "mistral"
         use_groq: Whether to use Groq API (only for llama)
         queries: List of test queries
+        use_cache: Reuse answers cached by earlier runs
+        stream_file: JSONL file each result is appended to as it finishes
+            (default: ../data/results/groq_eval_<model>.jsonl). If an
+            interrupted run left it behind, its queries are skipped.
 
     Returns:
         Evaluation results
@@ -43,71 +44,26 @@ def evaluate_model(model_type: str, use_groq: bool = False, queries: list = None
     print(f"Evaluating: {model_label.upper()}")
     print(f"{'='*60}\n")
 
-    # Initialize agent
+    # Groq is a remote API, so queries fan out with one agent per worker;
+    # the local Ollama model is compute-bound and stays sequential
+    workers = max(1, min(GROQ_JOBS, len(queries))) if use_groq else 1
+
+    # Initialize agents
     try:
-        agent = SJSUAgent(
-            model_type=model_type,
-            use_groq=use_groq,
-            verbose=False
+        evaluator = Evaluator(
+            model_type, use_groq, label=model_label, jobs=workers, use_cache=use_cache,
+            stream_file=stream_file or f"../data/results/groq_eval_{model_type}.jsonl"
         )
     except Exception as e:
         print(f"Failed to initialize agent: {e}")
         return None
 
-    results = []
-    total_queries = len(queries)
-
-    for idx, query_data in enumerate(queries, 1):
-        query = query_data['query']
-        print(f"\n[{idx}/{total_queries}] Query: {query[:80]}...")
-
-        # Run query
-        start_time = time.time()
-        try:
-            result = agent.query(query)
-            response = result.get('answer', '')
-            elapsed = time.time() - start_time
-
-            # Evaluate response
-            eval_result = EvaluationMetrics.evaluate_single_query(
-                query_data=query_data,
-                response=response,
-                response_time=elapsed,
-                model=model_label
-            )
-
-            results.append(eval_result)
-
-            # Print summary
-            print(f"Time: {elapsed:.2f}s")
-            print(f"Completeness: {eval_result['metrics']['completeness_score']:.2f}")
-            print(f"Response: {response[:100]}...")
-
-        except Exception as e:
-            print(f"Error: {str(e)[:100]}")
-            # Record timeout/error
-            elapsed = time.time() - start_time
-            eval_result = {
-                "query_id": query_data['id'],
-                "query": query,
-                "category": query_data.get('category', 'unknown'),
-                "model": model_label,
-                "response": f"Error: {str(e)}",
-                "metrics": {
-                    "response_time": elapsed,
-                    "completeness_score": 0.0,
-                    "relevance_score": 0.0,
-                    "length": {"characters": 0, "words": 0, "sentences": 0}
-                },
-                "completeness_details": {
-                    "score": 0.0,
-                    "found": [],
-                    "missing": query_data.get('expected_info', []),
-                    "total_expected": len(query_data.get('expected_info', []))
-                },
-                "timestamp": datetime.now().isoformat()
-            }
-            results.append(eval_result)    # Calculate summary statistics
+    def score(query_data, idx, total_queries, ask):
+        return _score_one(model_label, query_data, idx, total_queries, ask)
+
+    results = evaluator.run(queries, score)
+
+    # Calculate summary statistics
     summary = EvaluationMetrics.aggregate_results(results)
 
     print(f"SUMMARY - {model_label.upper()}")
@@ -127,32 +83,86 @@ def evaluate_model(model_type: str, use_groq: bool = False, queries: list = None
         "timestamp": datetime.now().isoformat()
     }
 
+def _score_one(model_label: str, query_data: Dict[str, Any], idx: int, total_queries: int,
+               ask: Ask) -> Dict[str, Any]:
+    """Run and score one query, recording errors as zero-scored results"""
+    query = query_data['query']
+    lines = [f"\n[{idx}/{total_queries}] Query: {query[:80]}..."]
+
+    # Run query
+    start_time = time.perf_counter_ns()
+    try:
+        result, elapsed = ask(query)
+        response = result.get('answer', '')
+
+        # Evaluate response
+        eval_result = EvaluationMetrics.evaluate_single_query(
+            query_data=query_data,
+            response=response,
+            response_time=elapsed,
+            model=model_label
+        )
+
+        # Print summary
+        lines.append(f"Time: {elapsed:.2f}s")
+        lines.append(f"Completeness: {eval_result['metrics']['completeness_score']:.2f}")
+        lines.append(f"Response: {response[:100]}...")
+
+    except Exception as e:
+        lines.append(f"Error: {str(e)[:100]}")
+        # Record timeout/error
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
+        eval_result = {
+            "query_id": query_data['id'],
+            "query": query,
+            "category": query_data.get('category', 'unknown'),
+            "model": model_label,
+            "response": f"Error: {str(e)}",
+            "metrics": {
+                "response_time": elapsed,
+                "completeness_score": 0.0,
+                "relevance_score": 0.0,
+                "length": {"characters": 0, "words": 0, "sentences": 0}
+            },
+            "completeness_details": {
+                "score": 0.0,
+                "found": [],
+                "missing": query_data.get('expected_info', []),
+                "total_expected": len(query_data.get('expected_info', []))
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+
+    print_block(lines)
+    return eval_result
+
 def compare_results(llama_results: Dict, mistral_results: Dict):
     """Print comparison between models"""
-    print("HEAD-TO-HEAD COMPARISON")
+    # The table is built up as lines and printed in one write
+    lines = ["HEAD-TO-HEAD COMPARISON"]
 
     llama_sum = llama_results['summary']['averages']
     mistral_sum = mistral_results['summary']['averages']
 
-    print(f"{'Metric':<25} {'Llama-3.3-70B (Groq)':<20} {'Mistral-7B (Local)':<20} {'Winner'}")
+    lines.append(f"{'Metric':<25} {'Llama-3.3-70B (Groq)':<20} {'Mistral-7B (Local)':<20} {'Winner'}")
 
     # Response Time
     llama_time = llama_sum['response_time']
     mistral_time = mistral_sum['response_time']
     time_winner = "Llama" if llama_time < mistral_time else "Mistral"
-    print(f"{'Avg Response Time':<25} {llama_time:>10.2f}s {mistral_time:>10.2f}s {time_winner}")
+    lines.append(f"{'Avg Response Time':<25} {llama_time:>10.2f}s {mistral_time:>10.2f}s {time_winner}")
 
     # Completeness
     llama_comp = llama_sum['completeness_score']
     mistral_comp = mistral_sum['completeness_score']
     comp_winner = "Llama" if llama_comp > mistral_comp else "Mistral"
-    print(f"{'Avg Completeness':<25} {llama_comp:>10.2f} {mistral_comp:>10.2f} {comp_winner}")
+    lines.append(f"{'Avg Completeness':<25} {llama_comp:>10.2f} {mistral_comp:>10.2f} {comp_winner}")
 
     # Relevance
     llama_rel = llama_sum['relevance_score']
     mistral_rel = mistral_sum['relevance_score']
     rel_winner = "Llama" if llama_rel > mistral_rel else "Mistral"
-    print(f"{'Avg Relevance':<25} {llama_rel:>10.2f} {mistral_rel:>10.2f} {rel_winner}")
+    lines.append(f"{'Avg Relevance':<25} {llama_rel:>10.2f} {mistral_rel:>10.2f} {rel_winner}")
 
     # Timeout rate
     llama_timeouts = sum(1 for r in llama_results['results'] if r['metrics']['completeness_score'] == 0.0)
@@ -162,23 +172,30 @@ def compare_results(llama_results: Dict, mistral_results: Dict):
     llama_timeout_rate = llama_timeouts / total * 100
     mistral_timeout_rate = mistral_timeouts / total * 100
     timeout_winner = "Llama" if llama_timeout_rate < mistral_timeout_rate else "Mistral"
-    print(f"{'Timeout Rate':<25} {llama_timeout_rate:>10.1f}% {mistral_timeout_rate:>10.1f}% {timeout_winner}")
+    lines.append(f"{'Timeout Rate':<25} {llama_timeout_rate:>10.1f}% {mistral_timeout_rate:>10.1f}% {timeout_winner}")
 
     # Overall winner
     llama_wins = sum([
-    llama_time < mistral_time,
-    llama_comp > mistral_comp,
-    llama_rel > mistral_rel,
-    llama_timeout_rate < mistral_timeout_rate
+        llama_time < mistral_time,
+        llama_comp > mistral_comp,
+        llama_rel > mistral_rel,
+        llama_timeout_rate < mistral_timeout_rate
     ])
 
     if llama_wins >= 3:
-        print("OVERALL WINNER: Llama-3.3-70B (Groq)")
+        lines.append("OVERALL WINNER: Llama-3.3-70B (Groq)")
     else:
-        print("OVERALL WINNER: Mistral-7B (Local)")
+        lines.append("OVERALL WINNER: Mistral-7B (Local)")
+
+    print("\n".join(lines))
 
 def main():
     """Run evaluation"""
+    parser = argparse.ArgumentParser(description="Compare Groq Llama-3.3-70B with local Mistral-7B")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse answers cached by earlier runs; their response times are from those runs")
+    args = parser.parse_args()
+
     print("GROQ API EVALUATION - Llama-3.3-70B vs Mistral-7B")
 
     # Check API key
@@ -193,20 +210,18 @@ def main():
 
     # Evaluate Mistral (local) first
     print("Evaluating Mistral-7B (Local Ollama)")
-    mistral_results = evaluate_model("mistral", use_groq=False, queries=queries)
+    mistral_results = evaluate_model("mistral", use_groq=False, queries=queries, use_cache=args.cache)
 
     # Save intermediate results
-    with open("../data/results/groq_eval_mistral.json", "w") as f:
-        json.dump(mistral_results, f, indent=2)
+    save_json(mistral_results, "../data/results/groq_eval_mistral.json")
     print(f"\n Mistral results saved to ../data/results/groq_eval_mistral.json")
 
     # Evaluate Llama (Groq)
     print("Evaluating Llama-3.3-70B (Groq API)")
-    llama_results = evaluate_model("llama", use_groq=True, queries=queries)
+    llama_results = evaluate_model("llama", use_groq=True, queries=queries, use_cache=args.cache)
 
     # Save results
-    with open("../data/results/groq_eval_llama.json", "w") as f:
-        json.dump(llama_results, f, indent=2)
+    save_json(llama_results, "../data/results/groq_eval_llama.json")
     print(f"\n Llama results saved to ../data/results/groq_eval_llama.json")
 
     # Compare results
@@ -223,8 +238,7 @@ def main():
             }
         }
 
-        with open("../data/results/groq_eval_combined.json", "w") as f:
-            json.dump(combined, f, indent=2)
+        save_json(combined, "../data/results/groq_eval_combined.json")
 
         print("\Combined results saved to ../data/results/groq_eval_combined.json")
         print("\nEvaluation complete!")
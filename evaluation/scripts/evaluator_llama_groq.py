@@ -3,8 +3,7 @@
 Evaluation with Groq API - Llama-3.3-70B Only
 """
 
-import json
-import time
+import argparse
 import sys
 import os
 from datetime import datetime
@@ -13,120 +12,48 @@ from typing import Dict, Any
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.agent.agent_orchestrator import SJSUAgent
-from evaluation.metrics import EvaluationMetrics
+from evaluation.scripts._evaluator_base import Evaluator, flat_statistics, score_flat
+from evaluation.scripts._output import save_json
+from evaluation.scripts._queries import load_test_queries as _load_test_queries
 
-def load_test_queries(file_path: str = "../data/queries/test_queries_custom.json"):
-    """Load test queries from JSON file"""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-        # Handle both formats: list or dict with 'queries' key
-        if isinstance(data, list):
-            return data
-        else:
-            return data['queries']
+def load_test_queries(file_path: str = "../data/queries/test_queries_custom.json", max_queries: int = None):
+    """Load test queries from JSON file (a list, or a dict with a 'queries' list)"""
+    return _load_test_queries(file_path, max_queries)
 
-def evaluate_model(queries: list = None) -> Dict[str, Any]:
+def evaluate_model(queries: list = None, use_cache: bool = False,
+                   stream_file: str = 'evaluation/llama_groq_results.jsonl', jobs: int = None) -> Dict[str, Any]:
     """
-    Evaluate Groq-powered Llama model
+    Evaluate Groq-powered Llama model (reusing answers cached by earlier runs with use_cache)
+
+    Each result is appended to stream_file as it finishes; if an interrupted
+    run left that file behind, the queries it already holds are skipped.
 
     Returns:
         Dict with evaluation results
     """
     print("\nEvaluating: LLAMA-3.3-70B (Groq API)\n")
 
-    # Initialize agent with Groq
-    agent = SJSUAgent(model_type='llama', use_groq=True)
+    # Initialize agents with Groq
+    evaluator = Evaluator('llama', use_groq=True, label='llama-groq', jobs=jobs,
+                          use_cache=use_cache, stream_file=stream_file)
 
     results = {
-    'model': 'Llama-3.3-70B (Groq)',
-    'queries': [],
-    'timestamp': datetime.now().isoformat()
+        'model': 'Llama-3.3-70B (Groq)',
+        'queries': [],
+        'timestamp': datetime.now().isoformat()
     }
 
-    metrics = EvaluationMetrics()
-
-    for i, query_data in enumerate(queries, 1):
-        query = query_data['query']
-    print(f"\n[{i}/{len(queries)}] Query: {query}...")
-
-    start_time = time.time()
-    try:
-        response_dict = agent.query(query)
-        response_time = time.time() - start_time
-
-        # Extract answer from response dict
-        response = response_dict.get('answer', str(response_dict))
-
-        # Calculate metrics
-        completeness_result = metrics.check_completeness(
-        response,
-            query_data.get('expected_info', [])
-        )
-        completeness = completeness_result['score']
-        relevance = metrics.check_relevance(query, response)
-        result = {
-        'query_id': query_data.get('id', i),
-        'query': query,
-        'category': query_data.get('category', 'unknown'),
-        'response': response,
-        'response_time': round(response_time, 2),
-        'completeness': round(completeness, 2),
-        'relevance': round(relevance, 2),
-        'success': True,
-        'timeout': False
-        }
-
-        print(f" Response time: {response_time:.2f}s | Completeness: {completeness:.2f} | Relevance: {relevance:.2f}")
-
-    except Exception as e:
-        response_time = time.time() - start_time
-        result = {
-        'query_id': query_data.get('id', i),
-        'query': query,
-        'category': query_data.get('category', 'unknown'),
-        'response': f"Error: {str(e)}",
-        'response_time': round(response_time, 2),
-        'completeness': 0.0,
-        'relevance': 0.0,
-        'success': False,
-        'timeout': response_time > 120,
-        'error': str(e)
-        }
-        print(f" Error: {str(e)}")
-
-    results['queries'].append(result)
-
-    # Brief pause between queries
-    time.sleep(1)
-
-    # Calculate overall statistics
-    successful_queries = [r for r in results['queries'] if r['success']]
-
-    if successful_queries:
-        results['statistics'] = {
-    'total_queries': len(queries),
-    'successful_queries': len(successful_queries),
-    'success_rate': round(len(successful_queries) / len(queries), 2),
-    'avg_response_time': round(sum(r['response_time'] for r in successful_queries) / len(successful_queries), 2),
-    'avg_completeness': round(sum(r['completeness'] for r in successful_queries) / len(successful_queries), 2),
-    'avg_relevance': round(sum(r['relevance'] for r in successful_queries) / len(successful_queries), 2),
-    'timeout_rate': round(sum(1 for r in results['queries'] if r.get('timeout', False)) / len(queries), 2)
-    }
-    else:
-        results['statistics'] = {
-    'total_queries': len(queries),
-    'successful_queries': 0,
-    'success_rate': 0.0,
-    'avg_response_time': 0.0,
-    'avg_completeness': 0.0,
-    'avg_relevance': 0.0,
-    'timeout_rate': 1.0
-    }
+    results['queries'] = evaluator.run(queries, score_flat)
+    results['statistics'] = flat_statistics(results['queries'], len(queries))
 
     return results
 
 def main():
+    parser = argparse.ArgumentParser(description="Evaluate Llama-3.3-70B on the Groq API")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse answers cached by earlier runs; their response times are from those runs")
+    args = parser.parse_args()
+
     print("GROQ API EVALUATION - Llama-3.3-70B Performance Test")
 
     # Check API key
@@ -144,12 +71,11 @@ def main():
     print("Evaluating Llama-3.3-70B with Groq API")
     print("="*60)
 
-    llama_results = evaluate_model(queries=queries)
+    llama_results = evaluate_model(queries=queries, use_cache=args.cache)
 
     # Save results
     output_file = 'evaluation/llama_groq_results.json'
-    with open(output_file, 'w') as f:
-        json.dump(llama_results, f, indent=2)
+    save_json(llama_results, output_file)
 
     print(f"\n Results saved to {output_file}")
 
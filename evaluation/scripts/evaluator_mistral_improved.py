@@ -3,37 +3,41 @@
 Evaluate Improved Mistral - Test if ReAct formatting improvements help
 """
 
-import json
-import time
-import sys
+import argparse
 import os
+import sys
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.agent.agent_orchestrator import SJSUAgent
 from evaluation.metrics import EvaluationMetrics
+from evaluation.scripts._evaluator_base import (
+    OLLAMA_NUM_PARALLEL, Ask, Evaluator, flat_statistics, print_block
+)
+from evaluation.scripts._failures import failure_indicators
+from evaluation.scripts._output import save_json
+from evaluation.scripts._queries import load_test_queries as _load_test_queries
 
 def load_test_queries(file_path: str = "../data/queries/test_queries_custom.json"):
-    """Load test queries from JSON file"""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-        if isinstance(data, list):
-            return data
-        else:
-            return data['queries']
+    """Load test queries from JSON file (a list, or a dict with a 'queries' list)"""
+    return _load_test_queries(file_path)
 
-def evaluate_mistral_improved() -> Dict[str, Any]:
-    """Evaluate improved Mistral model"""
+def evaluate_mistral_improved(jobs: int = OLLAMA_NUM_PARALLEL) -> Dict[str, Any]:
+    """Evaluate improved Mistral model, running up to `jobs` queries at once"""
 
     print(f"Evaluating: Mistral-7B (Improved)")
 
     # Load queries
     queries = load_test_queries()
 
-    # Initialize agent
-    agent = SJSUAgent(model_type="mistral", use_groq=False)
+    # Initialize agents. Answers are not cached: this run measures prompt
+    # changes, so earlier answers must not be reused
+    evaluator = Evaluator(
+        "mistral", use_groq=False, label="mistral-improved", jobs=jobs, use_cache=False,
+        stream_file="evaluation/mistral_improved.jsonl"
+    )
 
     results = {
         'model': 'Mistral-7B-Improved',
@@ -41,121 +45,117 @@ def evaluate_mistral_improved() -> Dict[str, Any]:
         'timestamp': datetime.now().isoformat()
         }
 
-    metrics = EvaluationMetrics()
-
-    for i, query_data in enumerate(queries, 1):
-        query = query_data['query']
-        print(f"\n[{i}/{len(queries)}] {query}...")
-
-        start_time = time.time()
-        try:
-            response_dict = agent.query(query)
-            response_time = time.time() - start_time
-
-            response = response_dict.get('answer', str(response_dict))
-            
-            # Calculate metrics
-            completeness_result = metrics.check_completeness(
-                response,
-                query_data.get('expected_info', [])
-                )
-            completeness = completeness_result['score']
-            relevance = metrics.check_relevance(query, response)
-        
-            # Check for failure indicators
-            has_parsing_error = 'OUTPUT_PARSING_FAILURE' in response
-            hit_iteration_limit = 'Agent stopped' in response
-
-            result = {
-                'query_id': query_data.get('id', i),
-                'query': query,
-                'category': query_data.get('category', 'unknown'),
-                'response': response,
-                'response_time': round(response_time, 2),
-                'completeness': round(completeness, 2),
-                'relevance': round(relevance, 2),
-                'success': not hit_iteration_limit,
-                'timeout': False,
-                'has_parsing_error': has_parsing_error,
-                'hit_iteration_limit': hit_iteration_limit
-                }
-
-                # Status indicator
-            if hit_iteration_limit:
-                status = " ITERATION LIMIT"
-            elif has_parsing_error:
-                status = "Warning: PARSING ERROR"
-            else:
-                status = ""
-
-            print(f"{status} {response_time:.2f}s | C:{completeness:.2f} | R:{relevance:.2f}")
-
-        except Exception as e:
-            response_time = time.time() - start_time
-            result = {
-                'query_id': query_data.get('id', i),
-                'query': query,
-                'category': query_data.get('category', 'unknown'),
-                'response': f"Error: {str(e)}",
-                'response_time': round(response_time, 2),
-                'completeness': 0.0,
-                'relevance': 0.0,
-                'success': False,
-                'timeout': response_time > 120,
-                'error': str(e),
-                'has_parsing_error': False,
-                'hit_iteration_limit': False
+    # Split every query's expected info into keywords once, before the
+    # scoring threads start, rather than on each check_completeness call
+    prepared = [EvaluationMetrics.prepare_expected_info(q.get('expected_info', [])) for q in queries]
+
+    results['queries'] = evaluator.run(
+        queries, lambda query_data, i, total, ask: _score_query(query_data, i, total, ask, prepared[i - 1])
+    )
+
+    # Calculate statistics, also counting parsing errors and iteration limits
+    results['statistics'] = flat_statistics(results['queries'], len(queries), counts=[
+        ('has_parsing_error', 'parsing_errors', 'parsing_error_rate'),
+        ('hit_iteration_limit', 'iteration_limits', 'iteration_limit_rate')
+    ])
+
+    return results
+
+def _score_query(
+    query_data: Dict[str, Any],
+    i: int,
+    total: int,
+    ask: Ask,
+    expected_info: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Dict[str, Any]:
+    """
+    Run and score one query, flagging parsing errors and iteration limits
+
+    expected_info is the query's expected info from prepare_expected_info.
+    """
+    query = query_data['query']
+    lines = [f"\n[{i}/{total}] {query}..."]
+
+    start_time = time.perf_counter_ns()
+    try:
+        response_dict, response_time = ask(query)
+
+        response = response_dict.get('answer', str(response_dict))
+
+        # Calculate metrics
+        completeness_result = EvaluationMetrics.check_completeness_precomputed(response, expected_info)
+        completeness = completeness_result['score']
+        relevance = EvaluationMetrics.check_relevance(query, response)
+
+        # Check for failure indicators
+        failures = failure_indicators(response)
+        has_parsing_error = 'parsing_error' in failures
+        hit_iteration_limit = 'agent_stopped' in failures
+
+        result = {
+            'query_id': query_data.get('id', i),
+            'query': query,
+            'category': query_data.get('category', 'unknown'),
+            'response': response,
+            'response_time': round(response_time, 2),
+            'completeness': round(completeness, 2),
+            'relevance': round(relevance, 2),
+            'success': not hit_iteration_limit,
+            'timeout': False,
+            'has_parsing_error': has_parsing_error,
+            'hit_iteration_limit': hit_iteration_limit
             }
-            print(f" ERROR: {str(e)[:60]}")
-
-        results['queries'].append(result)
-        time.sleep(1)
-
-        # Calculate statistics
-        successful_queries = [r for r in results['queries'] if r['success']]
-        parsing_errors = [r for r in results['queries'] if r.get('has_parsing_error', False)]
-        iteration_limits = [r for r in results['queries'] if r.get('hit_iteration_limit', False)]
-
-        if successful_queries:
-            results['statistics'] = {
-                'total_queries': len(queries),
-                'successful_queries': len(successful_queries),
-                'success_rate': round(len(successful_queries) / len(queries), 2),
-                'avg_response_time': round(sum(r['response_time'] for r in successful_queries) / len(successful_queries), 2),
-                'avg_completeness': round(sum(r['completeness'] for r in successful_queries) / len(successful_queries), 2),
-                'avg_relevance': round(sum(r['relevance'] for r in successful_queries) / len(successful_queries), 2),
-                'parsing_errors': len(parsing_errors),
-                'iteration_limits': len(iteration_limits),
-                'parsing_error_rate': round(len(parsing_errors) / len(queries), 2),
-                'iteration_limit_rate': round(len(iteration_limits) / len(queries), 2)
-                }
+
+        # Status indicator
+        if hit_iteration_limit:
+            status = " ITERATION LIMIT"
+        elif has_parsing_error:
+            status = "Warning: PARSING ERROR"
         else:
-            results['statistics'] = {
-                'total_queries': len(queries),
-                'successful_queries': 0,
-                'success_rate': 0.0,
-                'avg_response_time': 0.0,
-                'avg_completeness': 0.0,
-                'avg_relevance': 0.0,
-                'parsing_errors': len(parsing_errors),
-                'iteration_limits': len(iteration_limits),
-                'parsing_error_rate': round(len(parsing_errors) / len(queries), 2),
-                'iteration_limit_rate': round(len(iteration_limits) / len(queries), 2)
-                }
-
-        return results
+            status = ""
+
+        lines.append(f"{status} {response_time:.2f}s | C:{completeness:.2f} | R:{relevance:.2f}")
+
+    except Exception as e:
+        response_time = (time.perf_counter_ns() - start_time) / 1e9
+        result = {
+            'query_id': query_data.get('id', i),
+            'query': query,
+            'category': query_data.get('category', 'unknown'),
+            'response': f"Error: {str(e)}",
+            'response_time': round(response_time, 2),
+            'completeness': 0.0,
+            'relevance': 0.0,
+            'success': False,
+            'timeout': response_time > 120,
+            'error': str(e),
+            'has_parsing_error': False,
+            'hit_iteration_limit': False
+        }
+        lines.append(f" ERROR: {str(e)[:60]}")
+
+    print_block(lines)
+    return result
 
 def main():
     """Run evaluation"""
+    parser = argparse.ArgumentParser(description="Evaluate the improved Mistral-7B agent")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Also write an indented copy of the results for reading")
+    args = parser.parse_args()
+
     print("MISTRAL IMPROVEMENT EVALUATION")
 
     results = evaluate_mistral_improved()
 
-    # Save results
+    # Save results. The results file is read by scripts, so it is written compact
     output_file = "evaluation/mistral_improved.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    save_json(results, output_file, indent=False)
     print(f"\n Results saved to {output_file}")
+    if args.pretty:
+        pretty_file = "evaluation/mistral_improved.pretty.json"
+        save_json(results, pretty_file)
+        print(f" Readable copy saved to {pretty_file}")
 
     # Display summary
     stats = results['statistics']
@@ -4,12 +4,31 @@ Simple Speed Test - Groq Llama-3.3-70B Performance
 Tests raw LLM response speed without complex agent logic
 """
 
+import asyncio
 import time
 import os
 from langchain_groq import ChatGroq
 
-def test_groq_speed():
-    """Test Groq API response speed with 5 simple queries"""
+async def _timed_query(llm, i: int, query: str):
+    """Send one query and report its own response time; returns None on error"""
+    start = time.perf_counter_ns()
+    try:
+        response = await llm.ainvoke(query)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        response_text = response.content if hasattr(response, 'content') else str(response)
+        print(f"\n[{i}/5] Query: {query[:60]}...")
+        print(f" Response time: {elapsed:.2f}s")
+        print(f" Response: {response_text[:150]}...")
+        return elapsed
+
+    except Exception as e:
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        print(f"\n[{i}/5] Query: {query[:60]}...")
+        print(f" Error after {elapsed:.2f}s: {e}")
+        return None
+
+async def test_groq_speed():
+    """Test Groq API response speed with 5 simple queries, sent concurrently"""
 
     if not os.getenv("GROQ_API_KEY"):
         print("GROQ_API_KEY not set")
@@ -33,23 +52,11 @@ def test_groq_speed():
 
     print("GROQ LLAMA-3.3-70B SPEED TEST")
 
-    times = []
-
-    for i, query in enumerate(queries, 1):
-        print(f"\n[{i}/5] Query: {query[:60]}...")
-
-        start = time.time()
-        try:
-            response = llm.invoke(query)
-            elapsed = time.time() - start
-            times.append(elapsed)
-            response_text = response.content if hasattr(response, 'content') else str(response)
-            print(f" Response time: {elapsed:.2f}s")
-            print(f" Response: {response_text[:150]}...")
-
-        except Exception as e:
-            elapsed = time.time() - start
-            print(f" Error after {elapsed:.2f}s: {e}")
+    # All queries are in flight at once; each still reports its own latency
+    wall_start = time.perf_counter_ns()
+    elapsed = await asyncio.gather(*(_timed_query(llm, i, query) for i, query in enumerate(queries, 1)))
+    wall_time = (time.perf_counter_ns() - wall_start) / 1e9
+    times = [t for t in elapsed if t is not None]
 
     # Summary
     if times:
@@ -59,6 +66,7 @@ def test_groq_speed():
         print(f"Fastest: {min(times):.2f}s")
         print(f"Slowest: {max(times):.2f}s")
         print(f"Total time: {sum(times):.2f}s")
+        print(f"Wall time: {wall_time:.2f}s")
 
 if __name__ == "__main__":
-    test_groq_speed()
+    asyncio.run(test_groq_speed())
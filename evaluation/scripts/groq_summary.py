@@ -4,13 +4,18 @@ Quick summary of Groq evaluation results
 """
 
 import json
+import os
 import sys
 
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from evaluation.scripts._output import load_json
+
 def load_results(filepath):
     """Load results from JSON file"""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return load_json(filepath)
     except FileNotFoundError:
         print(f"File not found: {filepath}")
         return None
@@ -1,32 +1,40 @@
 #!/usr/bin/env python3
 """Print custom evaluation results summary"""
 
+import numpy as np
+
+
+def mean(values):
+    """Mean summed left to right like sum(); np.mean's pairwise sum can round 0.585 down"""
+    return np.cumsum(values)[-1] / len(values)
+
+
 print("CUSTOM EVALUATION RESULTS SUMMARY")
 
 # Mistral Results
-mistral_times = [165.24, 50.06, 104.05, 61.23, 15.94, 93.37, 33.11, 111.56,
+mistral_times = np.array([165.24, 50.06, 104.05, 61.23, 15.94, 93.37, 33.11, 111.56,
  58.34, 119.37, 14.24, 193.45, 98.68, 30.94, 81.16, 122.58,
- 57.92, 68.69, 19.67, 87.00]
+ 57.92, 68.69, 19.67, 87.00])
 
-mistral_comp = [0.67, 0.67, 0.50, 0.67, 0.33, 0.50, 0.67, 0.00, 0.67, 0.67,
- 1.00, 0.00, 1.00, 0.67, 1.00, 0.00, 0.67, 0.67, 0.67, 0.67]
+mistral_comp = np.array([0.67, 0.67, 0.50, 0.67, 0.33, 0.50, 0.67, 0.00, 0.67, 0.67,
+ 1.00, 0.00, 1.00, 0.67, 1.00, 0.00, 0.67, 0.67, 0.67, 0.67])
 
 # Llama Results
-llama_times = [39.3, 14.4, 84.1, 90.9, 15.1, 79.0, 72.2, 105.4, 102.3, 124.3,
- 5.0, 93.6, 85.4, 118.6, 128.7, 161.8, 90.7, 105.2, 98.7, 82.9]
+llama_times = np.array([39.3, 14.4, 84.1, 90.9, 15.1, 79.0, 72.2, 105.4, 102.3, 124.3,
+ 5.0, 93.6, 85.4, 118.6, 128.7, 161.8, 90.7, 105.2, 98.7, 82.9])
 
-llama_comp = [0.67, 0.33, 0.00, 0.00, 1.00, 0.00, 0.67, 0.00, 0.00, 1.00,
- 1.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.67, 0.00, 0.00, 0.00]
+llama_comp = np.array([0.67, 0.33, 0.00, 0.00, 1.00, 0.00, 0.67, 0.00, 0.00, 1.00,
+ 1.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.67, 0.00, 0.00, 0.00])
 
 print(f"{'MODEL':<20} {'AVG TIME':<15} {'AVG COMPLETE':<15} {'SUCCESS RATE':<15}")
 
-mistral_avg_time = sum(mistral_times) / len(mistral_times)
-mistral_avg_comp = sum(mistral_comp) / len(mistral_comp)
-mistral_success = sum(1 for c in mistral_comp if c > 0) / len(mistral_comp)
+mistral_avg_time = mean(mistral_times)
+mistral_avg_comp = mean(mistral_comp)
+mistral_success = (mistral_comp > 0).mean()
 
-llama_avg_time = sum(llama_times) / len(llama_times)
-llama_avg_comp = sum(llama_comp) / len(llama_comp)
-llama_success = sum(1 for c in llama_comp if c > 0) / len(llama_comp)
+llama_avg_time = mean(llama_times)
+llama_avg_comp = mean(llama_comp)
+llama_success = (llama_comp > 0).mean()
 
 print(f"{'Mistral-7B':<20} {mistral_avg_time:>10.2f}s {mistral_avg_comp:>10.2f} {mistral_success:>10.0%}")
 print(f"{'Llama-3.2-11B':<20} {llama_avg_time:>10.2f}s {llama_avg_comp:>10.2f} {llama_success:>10.0%}")
@@ -43,7 +51,7 @@ print(f" Difference: {abs(mistral_avg_comp - llama_avg_comp):.2f} ({abs(mistral_
 
 print(f"\nRELIABILITY: {'Mistral-7B' if mistral_success > llama_success else 'Llama-3.2-11B'}")
 print(f" Mistral: {mistral_success:.0%} success | Llama: {llama_success:.0%} success")
-print(f" Mistral timeouts: {sum(1 for c in mistral_comp if c == 0)}/20 | Llama timeouts: {sum(1 for c in llama_comp if c == 0)}/20")
+print(f" Mistral timeouts: {np.count_nonzero(mistral_comp == 0)}/20 | Llama timeouts: {np.count_nonzero(llama_comp == 0)}/20")
 
 print("FINAL RECOMMENDATION")
 print("\nWINNER: Mistral-7B")
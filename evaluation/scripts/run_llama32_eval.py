@@ -3,43 +3,103 @@
 Evaluate Llama-3.2-11B with working web search
 """
 
-import json
 import time
 import sys
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.agent.agent_orchestrator import AgentOrchestrator
-from src.llm.ollama_model import OllamaClient
-from src.database.db_manager import DatabaseManager
+from evaluation.scripts._agents import get_orchestrator, reset_agent
+from evaluation.scripts._evaluator_base import (
+    OLLAMA_NUM_PARALLEL, QueryOutcome, print_block
+)
+from evaluation.scripts._failures import failure_indicators
+from evaluation.scripts._output import ResultStream, save_json
+from evaluation.scripts._queries import load_test_queries as _load_test_queries
 
 
 def load_test_queries():
     """Load test queries"""
     query_file = os.path.join(os.path.dirname(__file__), '../data/queries/test_queries.json')
-    with open(query_file, 'r') as f:
-        data = json.load(f)
-        return data.get('test_queries', data.get('queries', data))
+    return _load_test_queries(query_file)
 
 
-def evaluate_llama32():
-    """Run Llama 3.2 evaluation"""
+def run_query(agents: queue.Queue, query_data, i, total) -> QueryOutcome:
+    """
+    Run one query with an orchestrator borrowed from the pool
+
+    Returns:
+        The query's outcome
+    """
+    query = query_data['query']
+    lines = [f"\n[{i}/{total}] {query}"]
+    
+    agent = agents.get()
+    reset_agent(agent)
+    start_time = time.perf_counter_ns()
+    try:
+        response = agent.run(query)
+        response_time = (time.perf_counter_ns() - start_time) / 1e9
+        
+        answer = response.get('response', response.get('answer', str(response)))
+        
+        # Check for success indicators
+        is_timeout = response_time > 120
+        failures = failure_indicators(answer)
+        has_error = 'error' in failures or 'parsing_error' in failures
+        hit_limit = 'agent_stopped' in failures or 'max_iterations' in failures
+        
+        success = not is_timeout and not has_error and not hit_limit
+        
+        result = {
+            'id': query_data.get('id', i),
+            'query': query,
+            'category': query_data.get('category', 'unknown'),
+            'response': answer[:500] + '...' if len(answer) > 500 else answer,
+            'response_time': round(response_time, 2),
+            'success': success,
+            'timeout': is_timeout,
+            'error': has_error,
+            'hit_limit': hit_limit
+        }
+        
+        status = "SUCCESS" if success else ("TIMEOUT" if is_timeout else "FAILED")
+        lines.append(f"Status: {status} | Time: {response_time:.2f}s")
+        lines.append(f"Answer preview: {answer[:150]}...")
+        return QueryOutcome(result, response_time, success, is_timeout)
+        
+    except Exception as e:
+        response_time = (time.perf_counter_ns() - start_time) / 1e9
+        lines.append(f"ERROR: {str(e)[:100]}")
+        return QueryOutcome({
+            'id': query_data.get('id', i),
+            'query': query,
+            'category': query_data.get('category', 'unknown'),
+            'response': f'Error: {str(e)}',
+            'response_time': round(response_time, 2),
+            'success': False,
+            'error': True
+        }, response_time, False, False)
+    finally:
+        agents.put(agent)
+        print_block(lines)
+
+
+def evaluate_llama32(jobs: int = OLLAMA_NUM_PARALLEL):
+    """Run Llama 3.2 evaluation, sending up to `jobs` queries to Ollama at once"""
     print("LLAMA-3.2-11B EVALUATION")
     print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
     # Initialize components
     print("Initializing Ollama Llama-3.2-11B client and agent...")
-    llm_client = OllamaClient(model_name="llama3.2-vision:11b")
-    db_manager = DatabaseManager()
-    agent = AgentOrchestrator(
-        llm_client=llm_client,
-        db_manager=db_manager,
-        max_iterations=10
-    )
+    agents = queue.Queue()
+    for slot in range(jobs):
+        agents.put(get_orchestrator("llama3.2-vision:11b", max_iterations=10, slot=slot))
     
     # Load queries
     queries = load_test_queries()
@@ -52,65 +112,45 @@ def evaluate_llama32():
         'statistics': {}
     }
     
-    total_time = 0
+    # Sum of the per-query response times, for the average
+    response_time_sum = 0
     successful = 0
     timeouts = 0
     
-    for i, query_data in enumerate(queries, 1):
-        query = query_data['query']
-        print(f"\n[{i}/{len(queries)}] {query}")
+    output_file = os.path.join(os.path.dirname(__file__), '../data/results/llama32_eval.json')
+    stream_file = os.path.join(os.path.dirname(__file__), '../data/results/llama32_eval.jsonl')
+    
+    def run_and_record(query_data, i):
+        """Run a query and append its outcome to the stream as soon as it finishes"""
+        done = stream.get(query_data.get('id', i))
+        if done is not None:
+            return QueryOutcome(done['result'], done['response_time'], done['success'], done['timeout'])
         
-        start_time = time.time()
-        try:
-            response = agent.run(query)
-            response_time = time.time() - start_time
-            
-            answer = response.get('response', response.get('answer', str(response)))
-            
-            # Check for success indicators
-            is_timeout = response_time > 120
-            has_error = 'error' in answer.lower() or 'OUTPUT_PARSING_FAILURE' in answer
-            hit_limit = 'Agent stopped' in answer or 'max iterations' in answer.lower()
-            
-            success = not is_timeout and not has_error and not hit_limit
-            
-            if is_timeout:
+        outcome = run_query(agents, query_data, i, len(queries))
+        stream.write({'id': query_data.get('id', i), **outcome._asdict()})
+        return outcome
+    
+    # Ollama batches concurrent requests, so queries no longer wait on each other.
+    # Outcomes are streamed to a JSONL file, so a crashed run resumes where it stopped.
+    # Queries overlap, so the run's total time is measured around them as a whole
+    start_time = time.perf_counter_ns()
+    with ResultStream(stream_file, flush_every=1, key='id') as stream, \
+            ThreadPoolExecutor(max_workers=jobs) as executor:
+        if stream.completed:
+            print(f"Resuming: {len(stream.completed)} queries already done")
+        futures = [
+            executor.submit(run_and_record, query_data, i)
+            for i, query_data in enumerate(queries, 1)
+        ]
+        for future in futures:
+            outcome = future.result()
+            if outcome.timeout:
                 timeouts += 1
-            if success:
+            if outcome.success:
                 successful += 1
-            
-            result = {
-                'id': query_data.get('id', i),
-                'query': query,
-                'category': query_data.get('category', 'unknown'),
-                'response': answer[:500] + '...' if len(answer) > 500 else answer,
-                'response_time': round(response_time, 2),
-                'success': success,
-                'timeout': is_timeout,
-                'error': has_error,
-                'hit_limit': hit_limit
-            }
-            
-            status = "SUCCESS" if success else ("TIMEOUT" if is_timeout else "FAILED")
-            print(f"Status: {status} | Time: {response_time:.2f}s")
-            print(f"Answer preview: {answer[:150]}...")
-            
-            total_time += response_time
-            results['queries'].append(result)
-            
-        except Exception as e:
-            response_time = time.time() - start_time
-            print(f"ERROR: {str(e)[:100]}")
-            results['queries'].append({
-                'id': query_data.get('id', i),
-                'query': query,
-                'category': query_data.get('category', 'unknown'),
-                'response': f'Error: {str(e)}',
-                'response_time': round(response_time, 2),
-                'success': False,
-                'error': True
-            })
-            total_time += response_time
+            results['queries'].append(outcome.result)
+            response_time_sum += outcome.response_time
+    total_time = (time.perf_counter_ns() - start_time) / 1e9
     
     # Calculate statistics
     results['statistics'] = {
@@ -119,15 +159,16 @@ def evaluate_llama32():
         'success_rate': round((successful / len(queries)) * 100, 1),
         'timeouts': timeouts,
         'timeout_rate': round((timeouts / len(queries)) * 100, 1),
-        'avg_response_time': round(total_time / len(queries), 2),
-        'total_time': round(total_time, 2)
+        'avg_response_time': round(response_time_sum / len(queries), 2),
+        'total_time': round(total_time, 2),
+        # Concurrent requests share Ollama, so each response time also covers
+        # serving the others; compare with earlier runs at the same setting
+        'concurrent_queries': jobs
     }
     
     # Save results
-    output_file = os.path.join(os.path.dirname(__file__), '../data/results/llama32_eval.json')
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    save_json(results, output_file)
     
     # Print summary
     print("LLAMA-3.2-11B EVALUATION SUMMARY")
@@ -138,6 +179,8 @@ def evaluate_llama32():
     print(f"Timeout Rate: {results['statistics']['timeout_rate']}%")
     print(f"Average Response Time: {results['statistics']['avg_response_time']}s")
     print(f"Total Time: {results['statistics']['total_time']}s")
+    if jobs > 1:
+        print(f"Note: {jobs} queries ran at once, so response times include Ollama serving the others")
     print(f"\nResults saved to: {output_file}")
     print(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
@@ -34,7 +34,14 @@ cmd = [
  "--theme.textColor", "#262730"
 ]
 
-try:
- subprocess.run(cmd)
-except KeyboardInterrupt:
- print("\n\n Shutting down SJSU Virtual Assistant...")
+if os.name == 'nt':
+ # Windows has no exec; wait on Streamlit as a child process
+ try:
+  subprocess.run(cmd)
+ except KeyboardInterrupt:
+  print("\n\n Shutting down SJSU Virtual Assistant...")
+else:
+ # Replace this process with Streamlit so no idle launcher stays behind;
+ # Streamlit handles Ctrl+C itself. Flush first, exec discards buffered output
+ sys.stdout.flush()
+ os.execvp(cmd[0], cmd)
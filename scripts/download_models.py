@@ -3,7 +3,15 @@ Download and cache embedding models for the SJSU Virtual Assistant
 Downloads sentence-transformers models required for semantic search
 """
 
+import importlib.util
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Use the faster Rust download backend when it is installed; huggingface_hub
+# fails if this is enabled without the hf_transfer package
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 from sentence_transformers import SentenceTransformer
 
 
@@ -22,15 +30,20 @@ def download_models():
     print(f"Downloading {len(models)} embedding models...")
     print()
     
-    for i, model_name in enumerate(models, 1):
-        print(f"[{i}/{len(models)}] Downloading {model_name}...")
-        try:
-            model = SentenceTransformer(model_name)
-            print(f"    Successfully downloaded and cached {model_name}")
-            print(f"    Model dimensions: {model.get_sentence_embedding_dimension()}")
-        except Exception as e:
-            print(f"    Error downloading {model_name}: {str(e)}")
-        print()
+    # Downloads are network-bound, so all models are fetched at once;
+    # each is reported as it finishes
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        futures = {executor.submit(SentenceTransformer, model_name): model_name for model_name in models}
+        for i, future in enumerate(as_completed(futures), 1):
+            model_name = futures[future]
+            print(f"[{i}/{len(models)}] {model_name}")
+            try:
+                model = future.result()
+                print(f"    Successfully downloaded and cached {model_name}")
+                print(f"    Model dimensions: {model.get_sentence_embedding_dimension()}")
+            except Exception as e:
+                print(f"    Error downloading {model_name}: {str(e)}")
+            print()
     
     print("Model download complete!")
     print()
@@ -3,12 +3,47 @@ Database Manager for SJSU Virtual Assistant
 Manages SQLite database operations for SJSU information retrieval
 """
 
+import re
 import sqlite3
 import json
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Optional, Sequence
 from pathlib import Path
 
 
+# Prepared statements kept per connection; sqlite3 keys its cache on the SQL text
+STATEMENT_CACHE_SIZE = 256
+
+# Default rows per multi-row INSERT, small enough for each batch to stay in the page cache
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Bound parameters allowed in one statement (SQLite's default limit is 32766)
+MAX_BOUND_PARAMETERS = 32000
+
+
+@lru_cache(maxsize=128)
+def _insert_sql(table: str, columns: tuple, row_count: int) -> str:
+    """Build (once) the multi-row INSERT text for a table, column list and row count"""
+    placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ", ".join([placeholders] * row_count)
+
+
+# Words too common to be useful as FAQ full-text search terms
+FTS_STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'at', 'be', 'can', 'do', 'does', 'for', 'how', 'i',
+    'in', 'is', 'it', 'me', 'my', 'of', 'on', 'or', 'sjsu', 'the', 'to', 'what',
+    'when', 'where', 'which', 'who', 'with'
+})
+
+
+def _fts_match_expression(text: str) -> str:
+    """Turn free text into an FTS5 query that ORs its quoted search terms"""
+    terms = [term for term in re.findall(r'\w+', text.lower()) if term not in FTS_STOPWORDS]
+    return " OR ".join(f'"{term}"' for term in dict.fromkeys(terms))
+
+
 class DatabaseManager:
     """Manages the SQLite database for SJSU information"""
     
@@ -32,12 +67,72 @@ class DatabaseManager:
     def _connect(self):
         """Connect to SQLite database"""
         try:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                              cached_statements=STATEMENT_CACHE_SIZE)
             self.connection.row_factory = sqlite3.Row
         except Exception as e:
             print(f"Error connecting to database: {e}")
             raise
     
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block of statements inside a single transaction
+        
+        Commits once when the block exits and rolls back if it raises,
+        so bulk writes pay for a single journal sync instead of one per statement.
+        
+        Yields:
+            The underlying sqlite3 connection
+        
+        Raises:
+            sqlite3.ProgrammingError: If the connection already has uncommitted
+                work, which a rollback of the block could otherwise not undo
+        """
+        if self.connection.in_transaction:
+            raise sqlite3.ProgrammingError(
+                "transaction() started with uncommitted changes; commit or roll them back first"
+            )
+        self.connection.execute("BEGIN")
+        try:
+            yield self.connection
+        except Exception:
+            self.connection.rollback()
+            raise
+        else:
+            self.connection.commit()
+    
+    def bulk_insert(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                    chunk_size: int = BULK_INSERT_CHUNK_SIZE) -> int:
+        """
+        Insert rows using multi-row INSERT ... VALUES statements
+        
+        Args:
+            table: Table name
+            columns: Column names, in the same order as each row's values
+            rows: Iterable of row tuples
+            chunk_size: Maximum rows per INSERT statement (default 500); lowered
+                automatically so a statement never binds more than
+                MAX_BOUND_PARAMETERS values
+            
+        Returns:
+            Number of rows inserted
+        """
+        columns = tuple(columns)
+        chunk_size = max(1, min(chunk_size, MAX_BOUND_PARAMETERS // len(columns)))
+        inserted = 0
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            params = [value for row in chunk for value in row]
+            # Identical SQL text reuses the connection's prepared statement
+            self.connection.execute(_insert_sql(table, columns, len(chunk)), params)
+            inserted += len(chunk)
+        
+        return inserted
+    
     def get_tables(self) -> List[str]:
         """Get list of tables in database"""
         cursor = self.connection.cursor()
@@ -184,18 +279,10 @@ class DatabaseManager:
         # Search FAQs using FTS table
         if len(results) < n_results:
             try:
-                cursor.execute("""
-                    SELECT f.question, f.answer, f.category
-                    FROM faqs f
-                    JOIN faqs_fts fts ON f.faq_id = fts.rowid
-                    WHERE faqs_fts MATCH ?
-                    LIMIT ?
-                """, (query_text, n_results - len(results)))
-                
-                for row in cursor.fetchall():
+                for faq in self.search_faqs(query_text, n_results - len(results)):
                     results.append({
-                        'content': f"Q: {row['question']}\nA: {row['answer']}",
-                        'category': row['category'] or 'general',
+                        'content': f"Q: {faq['question']}\nA: {faq['answer']}",
+                        'category': faq['category'] or 'general',
                         'source': 'faq',
                         'score': 0.9
                     })
@@ -299,19 +386,11 @@ class DatabaseManager:
             Query results
         """
         if category:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT question, answer, category
-                FROM faqs
-                WHERE category = ? AND faqs MATCH ?
-                LIMIT ?
-            """, (category, query_text, n_results))
-            
             results = []
-            for row in cursor.fetchall():
+            for faq in self.search_faqs(query_text, n_results, category=category):
                 results.append({
-                    'content': f"Q: {row['question']}\nA: {row['answer']}",
-                    'category': row['category'],
+                    'content': f"Q: {faq['question']}\nA: {faq['answer']}",
+                    'category': faq['category'],
                     'source': 'faq',
                     'score': 0.9
                 })
@@ -319,6 +398,39 @@ class DatabaseManager:
         else:
             return self.query(query_text, n_results)
     
+    def search_faqs(self, query_text: str, n_results: int = 5, category: str = None) -> List[Dict[str, Any]]:
+        """
+        Search FAQs through the faqs_fts full-text index, best matches first
+        
+        Args:
+            query_text: Free-text query; tokenized into OR-ed search terms
+            n_results: Maximum number of FAQs to return
+            category: FAQ category to restrict to (optional)
+            
+        Returns:
+            List of matching FAQs
+        """
+        match = _fts_match_expression(query_text)
+        if not match:
+            return []
+        
+        sql = """
+            SELECT f.faq_id, f.question, f.answer, f.category, f.keywords
+            FROM faqs_fts
+            JOIN faqs f ON f.faq_id = faqs_fts.rowid
+            WHERE faqs_fts MATCH ?
+        """
+        params = [match]
+        if category:
+            sql += " AND f.category = ?"
+            params.append(category)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(n_results)
+        
+        cursor = self.connection.cursor()
+        cursor.execute(sql, params)
+        return [dict(row) for row in cursor.fetchall()]
+    
     def get_prerequisites(self, course_code: str) -> Optional[Dict[str, Any]]:
         """
         Get prerequisites for a specific course
@@ -454,3 +566,18 @@ class DatabaseManager:
         """Close database connection"""
         if self.connection:
             self.connection.close()
+
+
+@lru_cache(maxsize=4)
+def get_db_manager(db_path: str = "./data/sjsu_database.db", collection_name: str = None) -> DatabaseManager:
+    """
+    Get a shared DatabaseManager, opening the database only once per path
+    
+    Args:
+        db_path: Path to SQLite database
+        collection_name: Not used for SQLite (kept for compatibility)
+        
+    Returns:
+        Cached DatabaseManager for these arguments
+    """
+    return DatabaseManager(db_path=db_path, collection_name=collection_name)
@@ -13,6 +13,7 @@ CREATE TABLE IF NOT EXISTS programs (
 
 CREATE INDEX idx_programs_name ON programs(program_name);
 CREATE INDEX idx_programs_department ON programs(department);
+CREATE INDEX idx_programs_degree ON programs(degree_type);
 
 -- Admission Requirements Table
 CREATE TABLE IF NOT EXISTS admission_requirements (
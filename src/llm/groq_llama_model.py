@@ -4,8 +4,31 @@ Provides interface to Groq's Llama models via API
 """
 
 import os
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from groq import Groq
+from groq import APIConnectionError, Groq, InternalServerError, RateLimitError
+
+from src.utils.rate_limiter import RateLimiter, pause
+
+
+# Groq's free tier allows 30 requests per minute; raise this for paid tiers
+GROQ_MAX_RPM = int(os.getenv("GROQ_MAX_RPM", 30))
+
+# Attempts per request when Groq rejects it (429, 5xx, dropped connection),
+# and the first backoff in seconds
+GROQ_RETRIES = 5
+GROQ_BACKOFF = 1.0
+
+# One limiter per process, so every client and thread shares the Groq budget
+GROQ_LIMITER = RateLimiter(GROQ_MAX_RPM, period=60.0)
+
+
+@lru_cache(maxsize=None)
+def _shared_client(api_key: str) -> Groq:
+    """Return the Groq SDK client for an API key, creating it on first use"""
+    # Retries happen in GroqLlamaClient._create, where each attempt goes
+    # through the rate limiter and the backoff is counted as waiting
+    return Groq(api_key=api_key, max_retries=0)
 
 
 class GroqLlamaClient:
@@ -25,11 +48,23 @@ class GroqLlamaClient:
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found in environment variables")
         
-        # Initialize Groq client
-        self.client = Groq(api_key=self.api_key)
+        # Clients for the same key share one connection pool, so concurrent
+        # agents reuse open HTTPS connections instead of each doing a handshake
+        self.client = _shared_client(self.api_key)
         
         print(f"Initialized Groq Llama client with model: {model_name}")
     
+    def _create(self, **kwargs):
+        """Send one chat completion request under the rate limit, retrying when Groq rejects it"""
+        for attempt in range(GROQ_RETRIES):
+            GROQ_LIMITER.acquire()
+            try:
+                return self.client.chat.completions.create(model=self.model_name, **kwargs)
+            except (RateLimitError, InternalServerError, APIConnectionError):
+                if attempt == GROQ_RETRIES - 1:
+                    raise
+                pause(GROQ_BACKOFF * 2 ** attempt)
+    
     def generate(
         self,
         system_prompt: str,
@@ -66,8 +101,7 @@ class GroqLlamaClient:
         
         try:
             # Call Groq API
-            response = self.client.chat.completions.create(
-                model=self.model_name,
+            response = self._create(
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens
@@ -112,8 +146,7 @@ class GroqLlamaClient:
         
         try:
             # Call Groq API with streaming
-            stream = self.client.chat.completions.create(
-                model=self.model_name,
+            stream = self._create(
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
@@ -147,8 +180,7 @@ class GroqLlamaClient:
             Response text
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
+            response = self._create(
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens
@@ -144,6 +144,28 @@ class DatabaseTool:
         except Exception as e:
             return f"Error querying by category: {str(e)}"
     
+    def search_faqs(self, query: str, n_results: int = 3) -> str:
+        """
+        Search FAQs using the full-text index
+        
+        Args:
+            query: Search query
+            n_results: Number of FAQs to return
+            
+        Returns:
+            Formatted FAQs
+        """
+        try:
+            faqs = self.db_manager.search_faqs(query, n_results=n_results)
+            
+            if not faqs:
+                return f"No FAQs found for '{query}'."
+            
+            return "\n\n".join(f"Q: {faq['question']}\nA: {faq['answer']}" for faq in faqs)
+            
+        except Exception as e:
+            return f"Error searching FAQs: {str(e)}"
+    
     def get_categories(self) -> List[str]:
         """
         Get available categories in the database
@@ -11,29 +11,50 @@ from tavily import TavilyClient
 class WebSearchTool:
     """Tool for searching the web for SJSU information using Tavily API"""
     
-    def __init__(self):
-        """Initialize the web search tool"""
+    # Tavily clients shared by every tool instance (keyed by API key) so
+    # searches reuse one keep-alive HTTP session instead of reconnecting
+    _clients: Dict[str, TavilyClient] = {}
+    
+    def __init__(self, max_results: int = 3):
+        """
+        Initialize the web search tool
+        
+        Args:
+            max_results: Default number of results per search
+        """
         self.name = "web_search"
         self.description = "Search the web for current information about SJSU"
+        self.max_results = max_results
         
         # Initialize Tavily client
         api_key = os.getenv("TAVILY_API_KEY")
         if not api_key:
             raise ValueError("TAVILY_API_KEY not found in environment variables")
-        self.client = TavilyClient(api_key=api_key)
+        self.client = self._get_client(api_key)
+    
+    @classmethod
+    def _get_client(cls, api_key: str) -> TavilyClient:
+        """Return the shared Tavily client for an API key, creating it on first use"""
+        client = cls._clients.get(api_key)
+        if client is None:
+            client = cls._clients[api_key] = TavilyClient(api_key=api_key)
+        return client
     
-    def execute(self, query: str, max_results: int = 3, include_domains: list = None) -> str:
+    def execute(self, query: str, max_results: Optional[int] = None, include_domains: list = None) -> str:
         """
         Execute a web search using Tavily
         
         Args:
             query: Search query
-            max_results: Maximum number of results to return
+            max_results: Maximum number of results to return (defaults to self.max_results)
             include_domains: Optional list of domains to prioritize (e.g., ['sjsu.edu'])
             
         Returns:
             Formatted search results
         """
+        if max_results is None:
+            max_results = self.max_results
+        
         try:
             # Add SJSU context to query if not present
             if "sjsu" not in query.lower() and "san jose state" not in query.lower():
@@ -99,13 +120,13 @@ class WebSearchTool:
         except Exception as e:
             return f"Error performing web search: {str(e)}"
     
-    def search_sjsu_site(self, query: str, max_results: int = 3) -> str:
+    def search_sjsu_site(self, query: str, max_results: Optional[int] = None) -> str:
         """
         Search specifically on sjsu.edu domain
         
         Args:
             query: Search query
-            max_results: Maximum results
+            max_results: Maximum results (defaults to self.max_results)
             
         Returns:
             Formatted search results
@@ -0,0 +1,59 @@
+"""
+Request rate limiting for API-backed model clients
+Keeps API calls under the provider's limit without pausing when it isn't needed
+"""
+
+import threading
+import time
+from collections import deque
+
+
+# Seconds each thread has spent waiting on a limiter or backing off, so
+# callers timing a request can leave the waits out
+_waits = threading.local()
+
+
+def _record_wait(seconds: float) -> None:
+    _waits.total = waited_seconds() + seconds
+
+
+def pause(seconds: float) -> None:
+    """Sleep, counting the time as waiting rather than work"""
+    time.sleep(seconds)
+    _record_wait(seconds)
+
+
+def waited_seconds() -> float:
+    """Total seconds the calling thread has spent in pause() or RateLimiter.acquire()"""
+    return getattr(_waits, 'total', 0.0)
+
+
+class RateLimiter:
+    """Allow at most max_calls calls in any period-second window, sleeping only when over it"""
+
+    def __init__(self, max_calls: int, period: float = 1.0):
+        """
+        Args:
+            max_calls: Calls allowed per window
+            period: Window length in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        # Shared by every worker thread; waiters queue up behind the lock
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another call fits in the window, then record it"""
+        # Queueing behind other waiters counts as waiting too
+        start = time.monotonic()
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    _record_wait(now - start)
+                    return
+                time.sleep(self.period - (now - self._calls[0]))
@@ -0,0 +1,105 @@
+"""
+Database Manager Tests
+Tests for DatabaseManager write helpers
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.database.db_manager import DatabaseManager, get_db_manager
+
+
+class TestDatabaseManagerWrites(unittest.TestCase):
+    """Test DatabaseManager bulk write helpers"""
+
+    def setUp(self):
+        """Create a throwaway database with a small table"""
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db = DatabaseManager(db_path=self.db_path)
+        self.db.connection.execute(
+            "CREATE TABLE items (item_id INTEGER PRIMARY KEY, name TEXT, qty INTEGER)"
+        )
+        self.db.connection.commit()
+
+    def tearDown(self):
+        """Close and remove the temporary database"""
+        self.db.close()
+        os.remove(self.db_path)
+
+    def _count(self):
+        return self.db.connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def test_bulk_insert_multiple_chunks(self):
+        """Test rows spanning several INSERT statements are all written"""
+        rows = [(f"item {i}", i) for i in range(25)]
+
+        inserted = self.db.bulk_insert('items', ['name', 'qty'], rows, chunk_size=10)
+
+        self.assertEqual(inserted, 25)
+        self.assertEqual(self._count(), 25)
+        last = self.db.connection.execute(
+            "SELECT name, qty FROM items ORDER BY item_id DESC LIMIT 1"
+        ).fetchone()
+        self.assertEqual(tuple(last), ("item 24", 24))
+
+    def test_bulk_insert_accepts_generator(self):
+        """Test rows can be streamed from a generator"""
+        inserted = self.db.bulk_insert('items', ['name', 'qty'], ((str(i), i) for i in range(3)))
+
+        self.assertEqual(inserted, 3)
+
+    @patch('src.database.db_manager.MAX_BOUND_PARAMETERS', 4)
+    def test_bulk_insert_respects_parameter_limit(self):
+        """Test chunks shrink so no statement exceeds the bound-parameter limit"""
+        rows = [(f"item {i}", i) for i in range(5)]
+
+        with patch.object(self.db, 'connection', wraps=self.db.connection) as connection:
+            inserted = self.db.bulk_insert('items', ['name', 'qty'], rows)
+
+        self.assertEqual(inserted, 5)
+        self.assertEqual(connection.execute.call_count, 3)
+        self.assertEqual(self._count(), 5)
+
+    def test_transaction_commits(self):
+        """Test a successful block is committed"""
+        with self.db.transaction():
+            self.db.bulk_insert('items', ['name', 'qty'], [("a", 1), ("b", 2)])
+
+        self.assertFalse(self.db.connection.in_transaction)
+        self.assertEqual(self._count(), 2)
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test a failing block leaves no rows behind"""
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.bulk_insert('items', ['name', 'qty'], [("a", 1)])
+                raise RuntimeError("boom")
+
+        self.assertEqual(self._count(), 0)
+
+    def test_transaction_refuses_pending_changes(self):
+        """Test a block is not started over uncommitted work"""
+        self.db.connection.execute("INSERT INTO items (name, qty) VALUES ('a', 1)")
+
+        with self.assertRaises(sqlite3.ProgrammingError):
+            with self.db.transaction():
+                pass
+
+        self.db.connection.rollback()
+        self.assertEqual(self._count(), 0)
+
+    def test_get_db_manager_reuses_instance(self):
+        """Test the shared manager is opened once per database path"""
+        first = get_db_manager(self.db_path)
+        self.addCleanup(get_db_manager.cache_clear)
+        self.addCleanup(first.close)
+
+        self.assertIs(get_db_manager(self.db_path), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Sample Data Population Tests
+Tests for reloading the seed data into an existing database
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from data import populate_data
+from src.database.db_manager import DatabaseManager
+
+
+SHIPPED_DB = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'sjsu_database.db')
+
+
+class TestPopulateSampleData(unittest.TestCase):
+    """Test populate_sample_data on an already populated database"""
+
+    def setUp(self):
+        """Copy the shipped database so the reload does not touch it"""
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        shutil.copyfile(SHIPPED_DB, self.db_path)
+        self.managers = []
+
+    def tearDown(self):
+        """Close and remove the temporary database"""
+        for db in self.managers:
+            db.close()
+        os.remove(self.db_path)
+
+    def _open(self):
+        db = DatabaseManager(db_path=self.db_path)
+        self.managers.append(db)
+        return db
+
+    def test_force_reload_keeps_faq_references(self):
+        """Test a forced reload points FAQs at the reloaded resources"""
+        with patch.object(populate_data, 'DatabaseManager', self._open):
+            populate_data.populate_sample_data(force=True)
+            populate_data.populate_sample_data(force=True)
+
+        connection = self.managers[-1].connection
+        self.assertEqual(connection.execute("PRAGMA foreign_key_check").fetchall(), [])
+        resource = connection.execute(
+            "SELECT r.resource_name FROM faqs f "
+            "JOIN campus_resources r ON r.resource_id = f.related_resource_id "
+            "WHERE f.question = 'How do I apply for on-campus housing?'"
+        ).fetchone()
+        self.assertEqual(resource[0], "Housing Office")
+
+
+if __name__ == '__main__':
+    unittest.main()